@@ -5,5 +5,6 @@ Contains all API endpoint implementations for Phase 3.
 
 from .job_routes import router as job_router
 from .websocket_routes import router as websocket_router
+from .legacy_routes import router as legacy_router
 
-__all__ = ["job_router", "websocket_router"] 
\ No newline at end of file
+__all__ = ["job_router", "websocket_router", "legacy_router"] 
\ No newline at end of file
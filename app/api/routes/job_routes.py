@@ -4,34 +4,185 @@ Handles upload, status tracking, download, and job CRUD operations.
 """
 
 import os
+import re
+import sys
+import time
+import uuid
+import asyncio
+import hashlib
+import tempfile
 import aiofiles
-from typing import Optional, List
+import orjson
+from typing import Optional, List, Callable
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Query, Request
-from fastapi.responses import FileResponse, JSONResponse
-from datetime import datetime
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from fastapi.routing import APIRoute
+from datetime import datetime, timezone
 
-from app.models.job_models import JobCreate, JobUpdate, JobResponse, JobMetadata
+from app.models.job_models import ISO_639_3_PATTERN, JobCreate, JobResponse, JobMetadata
 from app.models.translation_models import UploadResponse, JobListResponse
-from app.services.database_service import get_database_service
+from app.services.database_service import get_database_service, TERMINAL_STATUSES
 from app.services.job_queue_service import get_job_queue_service
-from app.services.util import get_env_var
+from app.services.util import ensure_dir, get_env_var
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v1", tags=["jobs"])
+class UploadSizeLimitedRoute(APIRoute):
+    """
+    APIRoute that rejects oversized request bodies from their Content-Length header.
+    
+    FastAPI parses multipart bodies before the endpoint runs, so checking the
+    size inside upload_video would only happen after the whole upload had been
+    received. Running the check here rejects it before a single body byte is read.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+        
+        async def size_limited_route_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_FILE_SIZE + MULTIPART_OVERHEAD_SLACK:
+                raise _file_too_large()
+            return await route_handler(request)
+        
+        return size_limited_route_handler
+
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["jobs"],
+    route_class=UploadSizeLimitedRoute,
+    default_response_class=ORJSONResponse
+)
+
+# Uploaded files are stored here; created once at import rather than per request
+UPLOADS_DIR = "uploads"
+ensure_dir(UPLOADS_DIR)
+
+# Bytes read from the start of an upload to check the MP4 'ftyp' signature
+MP4_SIGNATURE_PEEK_BYTES = 12
+
+# The upload form sends an empty source_language for auto-detect
+OPTIONAL_LANGUAGE_PATTERN = r"^([a-z]{3})?$"
+
+# Characters not allowed in stored upload filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]')
+
+# Public base URL of the service (e.g. https://translate.example.com).
+# When unset, URLs are derived from each request.
+APP_BASE_URL = (get_env_var("APP_BASE_URL", "") or "").rstrip('/') or None
+APP_WS_BASE_URL = None
+if APP_BASE_URL:
+    _scheme, _, _netloc = APP_BASE_URL.partition("://")
+    APP_WS_BASE_URL = f"{'wss' if _scheme == 'https' else 'ws'}://{_netloc}"
+
+# URL path templates for job resources
+JOB_STATUS_PATH = "/api/v1/jobs/{job_id}/status"
+JOB_PROGRESS_PATH = "/api/v1/jobs/{job_id}/progress"
+JOB_PREVIEW_PATH = "/api/v1/jobs/{job_id}/preview"
+JOB_DOWNLOAD_PATH = "/api/v1/jobs/{job_id}/download"
 
 # File size limit - configurable via environment variable
 MAX_FILE_SIZE = get_env_var("MAX_FILE_SIZE_MB", 200, int) * 1024 * 1024
 
+# Rejection payloads for oversize uploads, built once at import
+FILE_TOO_LARGE_DETAIL = f"File size exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
+
+# Allowance for multipart boundaries and form fields when checking Content-Length
+MULTIPART_OVERHEAD_SLACK = 1024 * 1024
+
+# Write buffer for the upload sink - configurable per filesystem.
+# Uploads are streamed in chunks of the same size so each read maps to one write.
+UPLOAD_WRITE_BUFFER = get_env_var("UPLOAD_WRITE_BUFFER", 4 * 1024 * 1024, int)
+UPLOAD_CHUNK_SIZE = UPLOAD_WRITE_BUFFER
+
+# /queue/status is served from an in-process cache for this many seconds
+QUEUE_STATUS_CACHE_TTL = get_env_var("QUEUE_STATUS_CACHE_TTL", 1.0, float)
+_queue_status_cache = {"ts": 0.0, "data": None, "etag": None}
+_queue_status_lock = asyncio.Lock()
+
+# Maximum bytes per sendfile() call when copying disk-backed uploads
+SENDFILE_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+# Chunk size used when streaming downloads - configurable via environment variable
+DOWNLOAD_CHUNK_SIZE = get_env_var("DOWNLOAD_CHUNK_SIZE", 4 * 1024 * 1024, int)
+
+
+# Set when uploads/outputs live on a network filesystem, so file stats are
+# moved off the event loop
+UPLOADS_ON_NETWORK_FS = get_env_var("UPLOADS_ON_NETWORK_FS", False, bool)
+
+
+class LargeChunkFileResponse(FileResponse):
+    """FileResponse that streams in large chunks (Starlette defaults to 64 KiB)."""
+    chunk_size = DOWNLOAD_CHUNK_SIZE
+
+
+def _file_too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=FILE_TOO_LARGE_DETAIL)
+
+
+def _spooled_upload_fd(file: UploadFile) -> Optional[int]:
+    """
+    Return the OS file descriptor backing an upload, if it has one.
+
+    Starlette spools uploads into a SpooledTemporaryFile which rolls over to a
+    real temp file once it exceeds its in-memory threshold. Only such disk-backed
+    uploads can be copied in-kernel with sendfile(), which is Linux-only for
+    regular-file destinations.
+    """
+    if sys.platform != "linux":
+        return None
+    
+    backing = file.file
+    if isinstance(backing, tempfile.SpooledTemporaryFile):
+        backing = backing._file  # BytesIO until rolled over to disk
+    
+    try:
+        return backing.fileno()
+    except (AttributeError, OSError):
+        return None
+
+
+def _sendfile_upload(src_fd: int, dst_path: str) -> int:
+    """Copy a disk-backed upload to dst_path with sendfile(). Returns bytes copied."""
+    size = os.fstat(src_fd).st_size
+    if size > MAX_FILE_SIZE:
+        raise _file_too_large()
+    
+    offset = 0
+    with open(dst_path, 'wb') as dst:
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src_fd, offset, min(size - offset, SENDFILE_CHUNK_SIZE))
+            if sent == 0:
+                break
+            offset += sent
+    
+    return offset
+
+
+async def _stream_upload(file: UploadFile, dst_path: str) -> int:
+    """Stream an upload to dst_path in chunks, enforcing the size limit as we go. Returns bytes written."""
+    file_size = 0
+    async with aiofiles.open(dst_path, 'wb', buffering=UPLOAD_WRITE_BUFFER) as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE:
+                raise _file_too_large()
+            await f.write(chunk)
+    
+    return file_size
+
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload_video(
     request: Request,
     file: UploadFile = File(..., description="Video file to translate (MP4 format, max 200MB)"),
-    target_language: str = Form(..., description="Target language for translation (ISO 639-3 code)"),
-    source_language: Optional[str] = Form(None, description="Source language (auto-detect if not provided)"),
+    target_language: str = Form(..., pattern=ISO_639_3_PATTERN, description="Target language for translation (ISO 639-3 code)"),
+    source_language: Optional[str] = Form(None, pattern=OPTIONAL_LANGUAGE_PATTERN, description="Source language (auto-detect if not provided)"),
     stt_engine: str = Form("auto", description="Speech-to-text engine (auto, faster-whisper, transformers)"),
     stt_model: str = Form("medium", description="Whisper model size (medium, large-v2, large-v3)"),
     translation_engine: str = Form("nllb", description="Translation engine (nllb)"),
@@ -48,13 +199,6 @@ async def upload_video(
     4. Returns job information with tracking URLs
     """
     
-    # Validate file size
-    if hasattr(file, 'size') and file.size and file.size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File size ({file.size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
-        )
-    
     # Validate file format
     if not file.filename or not file.filename.lower().endswith('.mp4'):
         raise HTTPException(
@@ -62,30 +206,35 @@ async def upload_video(
             detail="Only MP4 video files are supported"
         )
     
+    # Check the MP4 signature (an 'ftyp' box at offset 4) before writing
+    # anything, so renamed non-video files are rejected without a disk copy
+    head = await file.read(MP4_SIGNATURE_PEEK_BYTES)
+    await file.seek(0)
+    if head[4:8] != b'ftyp':
+        raise HTTPException(
+            status_code=415,
+            detail="Uploaded file is not a valid MP4 video"
+        )
+    
     try:
-        # Create uploads directory if it doesn't exist
-        uploads_dir = "uploads"
-        os.makedirs(uploads_dir, exist_ok=True)
-        
-        # Generate unique filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        safe_filename = f"{timestamp}_{file.filename}"
-        file_path = os.path.join(uploads_dir, safe_filename)
-        
-        # Save uploaded file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
-        
-        file_size = len(content)
-        
-        # Validate file size after reading
-        if file_size > MAX_FILE_SIZE:
-            os.remove(file_path)  # Clean up
-            raise HTTPException(
-                status_code=413,
-                detail=f"File size ({file_size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)"
-            )
+        # Generate unique filename (also strips any path components from the client filename)
+        safe_filename = f"{uuid.uuid4().hex}_{_UNSAFE_FILENAME_CHARS.sub('_', file.filename)}"
+        file_path = os.path.join(UPLOADS_DIR, safe_filename)
+        
+        # Save uploaded file under a temporary name and rename on success,
+        # so a crash mid-upload never leaves a partial file at file_path
+        tmp_path = f"{file_path}.part"
+        try:
+            src_fd = _spooled_upload_fd(file)
+            if src_fd is not None:
+                file_size = await asyncio.to_thread(_sendfile_upload, src_fd, tmp_path)
+            else:
+                file_size = await _stream_upload(file, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)  # Clean up partial upload
+            raise
         
         # Create job metadata
         job_metadata = JobMetadata(
@@ -119,12 +268,13 @@ async def upload_video(
         
         # Submit job for processing
         job_queue = get_job_queue_service()
-        await job_queue.submit_job(job)
+        await job_queue.submit_job_batched(job)
         
         # Build response URLs
-        base_url = str(request.base_url).rstrip('/')
-        status_url = f"{base_url}/api/v1/jobs/{job.id}/status"
-        websocket_url = f"ws://{request.headers.get('host', 'localhost')}/api/v1/jobs/{job.id}/progress"
+        base_url = APP_BASE_URL or str(request.base_url).rstrip('/')
+        ws_base_url = APP_WS_BASE_URL or f"ws://{request.headers.get('host', 'localhost')}"
+        status_url = base_url + JOB_STATUS_PATH.format(job_id=job.id)
+        websocket_url = ws_base_url + JOB_PROGRESS_PATH.format(job_id=job.id)
         
         # Create processing config
         processing_config = {
@@ -137,7 +287,7 @@ async def upload_video(
             "tts_engine": tts_engine
         }
         
-        logger.info(f"Created and submitted job {job.id} for file {file.filename}")
+        logger.info("Created and submitted job %s for file %s", job.id, file.filename)
         
         return UploadResponse(
             job_id=job.id,
@@ -148,19 +298,19 @@ async def upload_video(
             websocket_url=websocket_url,
             processing_config=processing_config,
             created_at=job.created_at
-        )
+        ).as_response()
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Upload failed: {e}")
+        logger.error("Upload failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Upload failed: {str(e)}"
         )
 
 
-@router.get("/jobs/{job_id}/status", response_model=JobResponse)
+@router.get("/jobs/{job_id}/status", response_model=JobResponse, response_model_exclude_none=True)
 async def get_job_status(
     request: Request,
     job_id: str
@@ -169,12 +319,14 @@ async def get_job_status(
     Get the current status and information for a specific job.
     
     Returns detailed job information including progress, timestamps,
-    and download URLs when available.
+    and download URLs when available. Responses carry an ETag derived from
+    the job's updated_at, so polling clients can send If-None-Match and get
+    a 304 while the job is unchanged.
     """
     
     try:
         db_service = await get_database_service()
-        job = await db_service.get_job(job_id)
+        job = await db_service.get_job_ro(job_id)
         
         if not job:
             raise HTTPException(
@@ -182,45 +334,60 @@ async def get_job_status(
                 detail=f"Job {job_id} not found"
             )
         
-        # Extract progress information from metadata
-        progress_stage = None
-        progress_percentage = None
-        
-        if job.job_metadata:
-            progress_stage = job.job_metadata.get("progress_stage")
-            progress_percentage = job.job_metadata.get("progress_percentage")
+        etag = f'W/"{int(job.updated_at.timestamp() * 1000)}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         
         # Build download and preview URLs
-        base_url = str(request.base_url).rstrip('/')
+        base_url = APP_BASE_URL or str(request.base_url).rstrip('/')
         download_url = None
-        preview_url = f"{base_url}/api/v1/jobs/{job_id}/preview"
+        preview_url = base_url + JOB_PREVIEW_PATH.format(job_id=job_id)
         
         if job.status == "completed" and job.output_file_path:
-            download_url = f"{base_url}/api/v1/jobs/{job_id}/download"
+            download_url = base_url + JOB_DOWNLOAD_PATH.format(job_id=job_id)
         
-        return JobResponse(
-            job_id=job.id,
-            status=job.status,
-            original_filename=job.original_filename,
-            source_language=job.source_language,
-            target_language=job.target_language,
-            progress_stage=progress_stage,
-            progress_percentage=progress_percentage,
-            input_file_size=job.input_file_size,
-            output_file_size=job.output_file_size,
-            processing_time_seconds=job.processing_time_seconds,
-            error_message=job.error_message,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            completed_at=job.completed_at,
+        return JobResponse.from_job(
+            job,
             download_url=download_url,
             preview_url=preview_url
-        )
+        ).as_response(exclude_none=True, headers={"ETag": etag})
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job status {job_id}: {e}")
+        logger.error("Failed to get job status %s: %s", job_id, e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get job status: {str(e)}"
+        )
+
+
+@router.get("/jobs/{job_id}/status/lite")
+async def get_job_status_lite(job_id: str):
+    """
+    Get a minimal progress snapshot for a job.
+
+    Intended for polling clients: returns only status, progress stage,
+    progress percentage and updated_at, read straight from the database
+    without building the full JobResponse. Use /status for everything else.
+    """
+
+    try:
+        db_service = await get_database_service()
+        status = await db_service.get_job_status_lite(job_id)
+
+        if not status:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Job {job_id} not found"
+            )
+
+        return ORJSONResponse(status)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to get job status %s: %s", job_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get job status: {str(e)}"
@@ -238,7 +405,7 @@ async def download_translated_video(job_id: str):
     
     try:
         db_service = await get_database_service()
-        job = await db_service.get_job(job_id)
+        job = await db_service.get_job_ro(job_id)
         
         if not job:
             raise HTTPException(
@@ -252,7 +419,15 @@ async def download_translated_video(job_id: str):
                 detail=f"Job {job_id} is not completed (status: {job.status})"
             )
         
-        if not job.output_file_path or not os.path.exists(job.output_file_path):
+        try:
+            if not job.output_file_path:
+                raise FileNotFoundError(job.output_file_path)
+            if UPLOADS_ON_NETWORK_FS:
+                # stat() can block for a long time on network mounts
+                stat_result = await asyncio.to_thread(os.stat, job.output_file_path)
+            else:
+                stat_result = os.stat(job.output_file_path)
+        except FileNotFoundError:
             raise HTTPException(
                 status_code=404,
                 detail=f"Output file for job {job_id} not found"
@@ -261,12 +436,13 @@ async def download_translated_video(job_id: str):
         # Generate download filename
         download_filename = f"translated_{job.original_filename}"
         
-        logger.info(f"Serving download for job {job_id}: {job.output_file_path}")
+        logger.info("Serving download for job %s: %s", job_id, job.output_file_path)
         
-        return FileResponse(
+        return LargeChunkFileResponse(
             path=job.output_file_path,
             filename=download_filename,
             media_type="video/mp4",
+            stat_result=stat_result,
             headers={
                 "Content-Disposition": f"attachment; filename={download_filename}",
                 "Cache-Control": "no-cache"
@@ -276,7 +452,7 @@ async def download_translated_video(job_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Download failed for job {job_id}: {e}")
+        logger.error("Download failed for job %s: %s", job_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Download failed: {str(e)}"
@@ -294,7 +470,7 @@ async def get_job_preview(job_id: str):
     
     try:
         db_service = await get_database_service()
-        job = await db_service.get_job(job_id)
+        job = await db_service.get_job_ro(job_id)
         
         if not job:
             raise HTTPException(
@@ -311,16 +487,16 @@ async def get_job_preview(job_id: str):
             "source_language": job.source_language,
             "target_language": job.target_language,
             "created_at": job.created_at,
-            "metadata": job.job_metadata,
+            "metadata": job.job_metadata.model_dump() if job.job_metadata else None,
             "preview_note": "Enhanced preview with thumbnails and clips available in Phase 4"
         }
         
-        return JSONResponse(content=preview_info)
+        return ORJSONResponse(content=preview_info)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Preview failed for job {job_id}: {e}")
+        logger.error("Preview failed for job %s: %s", job_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Preview failed: {str(e)}"
@@ -345,39 +521,22 @@ async def list_jobs(
         # Calculate offset
         offset = (page - 1) * page_size
         
-        # Get jobs and total count
-        jobs = await db_service.list_jobs(status=status, limit=page_size, offset=offset)
-        total_count = await db_service.count_jobs(status=status)
-        
-        # Convert jobs to dict format
-        jobs_data = []
-        for job in jobs:
-            job_dict = {
-                "job_id": job.id,
-                "status": job.status,
-                "original_filename": job.original_filename,
-                "source_language": job.source_language,
-                "target_language": job.target_language,
-                "file_size": job.input_file_size,
-                "created_at": job.created_at,
-                "updated_at": job.updated_at,
-                "completed_at": job.completed_at,
-                "processing_time_seconds": job.processing_time_seconds,
-                "error_message": job.error_message
-            }
-            jobs_data.append(job_dict)
+        # Get jobs (as summary dicts) and total count in a single round-trip
+        jobs_data, total_count = await db_service.list_jobs_with_total(
+            status=status, limit=page_size, offset=offset, as_dict=True
+        )
         
-        logger.info(f"Listed {len(jobs)} jobs (page {page}, status filter: {status})")
+        logger.info("Listed %s jobs (page %s, status filter: %s)", len(jobs_data), page, status)
         
-        return JobListResponse(
-            jobs=jobs_data,
-            total_count=total_count,
-            page=page,
-            page_size=page_size
-        )
+        return ORJSONResponse({
+            "jobs": jobs_data,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size
+        })
         
     except Exception as e:
-        logger.error(f"Failed to list jobs: {e}")
+        logger.error("Failed to list jobs: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list jobs: {str(e)}"
@@ -394,40 +553,38 @@ async def cancel_job(job_id: str):
     """
     
     try:
-        db_service = await get_database_service()
-        job = await db_service.get_job(job_id)
-        
-        if not job:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Job {job_id} not found"
-            )
-        
-        if job.status in ["completed", "failed", "cancelled"]:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Job {job_id} cannot be cancelled (status: {job.status})"
-            )
-        
-        # Try to cancel from job queue
+        # Try to cancel from job queue (cheap, in-process)
         job_queue = get_job_queue_service()
         cancelled = await job_queue.cancel_job(job_id)
         
         if not cancelled:
-            # Job wasn't in active processing, update database directly
-            await db_service.update_job(
-                job_id,
-                JobUpdate(status="cancelled", completed_at=datetime.utcnow())
-            )
-        
-        logger.info(f"Cancelled job {job_id}")
+            # Job wasn't in active processing, cancel it in the database if still unfinished
+            db_service = await get_database_service()
+            cancelled_job = await db_service.cancel_job_if_active(job_id)
+            
+            if not cancelled_job:
+                # Only look the job up to tell "not found" apart from "already finished"
+                job = await db_service.get_job(job_id)
+                
+                if not job:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Job {job_id} not found"
+                    )
+                
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Job {job_id} cannot be cancelled (status: {job.status})"
+                )
+        
+        logger.info("Cancelled job %s", job_id)
         
         return {"message": f"Job {job_id} cancelled successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to cancel job {job_id}: {e}")
+        logger.error("Failed to cancel job %s: %s", job_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to cancel job: {str(e)}"
@@ -445,7 +602,7 @@ async def get_job_details(job_id: str):
     
     try:
         db_service = await get_database_service()
-        job = await db_service.get_job(job_id)
+        job = await db_service.get_job_ro(job_id)
         
         if not job:
             raise HTTPException(
@@ -453,36 +610,17 @@ async def get_job_details(job_id: str):
                 detail=f"Job {job_id} not found"
             )
         
-        # Return complete job information
-        job_details = {
-            "id": job.id,
-            "original_filename": job.original_filename,
-            "source_language": job.source_language,
-            "target_language": job.target_language,
-            "status": job.status,
-            "input_file_path": job.input_file_path,
-            "output_file_path": job.output_file_path,
-            "input_file_size": job.input_file_size,
-            "output_file_size": job.output_file_size,
-            "processing_time_seconds": job.processing_time_seconds,
-            "error_message": job.error_message,
-            "stt_engine": job.stt_engine,
-            "stt_model": job.stt_model,
-            "translation_engine": job.translation_engine,
-            "translation_model": job.translation_model,
-            "tts_engine": job.tts_engine,
-            "job_metadata": job.job_metadata,
-            "created_at": job.created_at,
-            "updated_at": job.updated_at,
-            "completed_at": job.completed_at
-        }
+        # Terminal jobs are served from the details cached at completion
+        if job.status in TERMINAL_STATUSES and job.details_json:
+            return Response(content=job.details_json, media_type="application/json")
         
-        return JSONResponse(content=job_details)
+        # Return complete job information
+        return ORJSONResponse(job.details_dict())
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get job details {job_id}: {e}")
+        logger.error("Failed to get job details %s: %s", job_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get job details: {str(e)}"
@@ -490,37 +628,71 @@ async def get_job_details(job_id: str):
 
 
 @router.get("/queue/status")
-async def get_queue_status():
+async def get_queue_status(request: Request, response: Response):
     """
     Get current job queue status and statistics.
     
     Returns information about active jobs, queue size, and processing capacity.
+    Results are cached for QUEUE_STATUS_CACHE_TTL seconds so that dashboard
+    polling from many clients collapses into a single backend fetch.
     """
     
     try:
+        status_data, etag = await _get_cached_queue_status()
+        
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
+        return status_data
+        
+    except Exception as e:
+        logger.error("Failed to get queue status: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get queue status: {str(e)}"
+        )
+
+
+async def _get_cached_queue_status():
+    """Return (status payload, ETag), refreshing the cache when it is older than the TTL."""
+    if time.monotonic() - _queue_status_cache["ts"] < QUEUE_STATUS_CACHE_TTL:
+        return _queue_status_cache["data"], _queue_status_cache["etag"]
+    
+    async with _queue_status_lock:
+        # Another caller may have refreshed the cache while we waited
+        if time.monotonic() - _queue_status_cache["ts"] < QUEUE_STATUS_CACHE_TTL:
+            return _queue_status_cache["data"], _queue_status_cache["etag"]
+        
         job_queue = get_job_queue_service()
         queue_status = job_queue.get_queue_status()
         
         # Get database statistics
         db_service = await get_database_service()
+        counts = await db_service.count_jobs_by_status()
         db_stats = {
-            "total_jobs": await db_service.count_jobs(),
-            "uploaded_jobs": await db_service.count_jobs("uploaded"),
-            "processing_jobs": await db_service.count_jobs("processing"),
-            "completed_jobs": await db_service.count_jobs("completed"),
-            "failed_jobs": await db_service.count_jobs("failed"),
-            "cancelled_jobs": await db_service.count_jobs("cancelled")
+            "total_jobs": sum(counts.values()),
+            "uploaded_jobs": counts.get("uploaded", 0),
+            "processing_jobs": counts.get("processing", 0),
+            "completed_jobs": counts.get("completed", 0),
+            "failed_jobs": counts.get("failed", 0),
+            "cancelled_jobs": counts.get("cancelled", 0)
         }
         
-        return {
+        status_data = {
             "queue": queue_status,
             "database": db_stats,
-            "timestamp": datetime.utcnow()
+            "connection": db_service.connection_stats(),
+            "timestamp": datetime.now(timezone.utc)
         }
+        etag_source = (
+            tuple(sorted(counts.items())),
+            queue_status["queue_size"],
+            tuple(queue_status["active_job_ids"])
+        )
+        # A stable digest (not hash(), which is salted per process) so every
+        # worker returns the same ETag for the same state
+        etag = f'W/"{hashlib.blake2b(orjson.dumps(etag_source), digest_size=8).hexdigest()}"'
         
-    except Exception as e:
-        logger.error(f"Failed to get queue status: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get queue status: {str(e)}"
-        ) 
\ No newline at end of file
+        _queue_status_cache.update(ts=time.monotonic(), data=status_data, etag=etag)
+        return status_data, etag
@@ -0,0 +1,211 @@
+"""
+Legacy Phase 2 API routes for the AI Video Translation Service.
+Model status, supported languages and the deprecated direct translation endpoint.
+"""
+
+import asyncio
+import hashlib
+import orjson
+from typing import Optional
+from pydantic import ValidationError
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+
+from app.models.translation_models import ModelPreloadRequest
+from app.services.util import utcnow_iso
+
+router = APIRouter(prefix="/api/v1", tags=["legacy"])
+
+
+# ModelPreloadRequest is parsed from the raw body, so document it explicitly
+# (with the nested spec inlined, as '#/$defs' refs do not resolve in OpenAPI)
+_preload_request_schema = ModelPreloadRequest.model_json_schema()
+_preload_request_schema["properties"]["models"]["items"] = _preload_request_schema.pop("$defs")["ModelPreloadSpec"]
+_PRELOAD_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _preload_request_schema}}
+    }
+}
+
+
+@router.get("/models")
+async def get_model_status(request: Request):
+    """
+    Get status information about cached models and AI services.
+    (Legacy Phase 2 endpoint - maintained for compatibility)
+    """
+    try:
+        translation_service = getattr(request.app.state, "translation_service", None)
+        if translation_service:
+            model_status = translation_service.get_model_status()
+        else:
+            model_status = {"error": "Translation service not initialized"}
+        
+        return {
+            "status": "success",
+            "timestamp": utcnow_iso(),
+            "model_cache": model_status,
+            "note": "This is a legacy Phase 2 endpoint. Use /health for comprehensive status."
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get model status: {str(e)}"
+        )
+
+
+@router.delete("/models/cache")
+async def clear_model_cache(
+    request: Request,
+    min_idle_secs: Optional[float] = Query(None, ge=0, description="Only evict models idle for at least this many seconds")
+):
+    """
+    Evict cached models.
+    
+    Without min_idle_secs every cached model is dropped; with it, recently
+    used models stay resident and only idle ones are evicted.
+    """
+    try:
+        ai_factory = request.app.state.ai_factory
+        
+        if min_idle_secs is None:
+            evicted = ai_factory.clear_cache()
+        else:
+            evicted = ai_factory.evict_idle_models(min_idle_secs)
+        
+        return {
+            "status": "success",
+            "evicted_models": evicted,
+            "timestamp": utcnow_iso()
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to clear model cache: {str(e)}"
+        )
+
+
+@router.post("/models/preload", openapi_extra=_PRELOAD_REQUEST_OPENAPI)
+async def preload_models(request: Request):
+    """
+    Load the listed models into the model cache ahead of use.
+    
+    With MODEL_CACHE_MAX_MODELS set, preloading may evict the least
+    recently used models to make room.
+    """
+    # Parse and validate the raw body in one pydantic-core pass instead of
+    # json.loads followed by model validation
+    try:
+        preload_request = ModelPreloadRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+    
+    try:
+        ai_factory = request.app.state.ai_factory
+        models = [(spec.model_type, spec.model_name) for spec in preload_request.models]
+        
+        # Model loading is blocking, keep it off the event loop
+        loaded = await asyncio.to_thread(ai_factory.preload_models, models)
+        
+        if loaded == len(models):
+            status = "success"
+        else:
+            status = "partial" if loaded else "failed"
+        
+        return {
+            "status": status,
+            "requested_models": len(models),
+            "loaded_models": loaded,
+            "timestamp": utcnow_iso()
+        }
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid model type: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to preload models: {str(e)}"
+        )
+
+
+# Basic language support - simplified for Phase 5; serialized once at import
+_LANGUAGES_PAYLOAD_BYTES = orjson.dumps({
+    "status": "success",
+    "languages": {
+        "source_languages": [
+            {"code": "eng", "name": "English"},
+            {"code": "spa", "name": "Spanish"},
+            {"code": "fra", "name": "French"},
+            {"code": "deu", "name": "German"},
+            {"code": "ita", "name": "Italian"},
+            {"code": "por", "name": "Portuguese"},
+            {"code": "jpn", "name": "Japanese"},
+            {"code": "kor", "name": "Korean"},
+            {"code": "cmn", "name": "Chinese (Mandarin)"},
+            {"code": "hin", "name": "Hindi"}
+        ],
+        "target_languages": [
+            {"code": "eng", "name": "English"},
+            {"code": "spa", "name": "Spanish"},
+            {"code": "fra", "name": "French"},
+            {"code": "deu", "name": "German"},
+            {"code": "ita", "name": "Italian"},
+            {"code": "por", "name": "Portuguese"},
+            {"code": "jpn", "name": "Japanese"},
+            {"code": "kor", "name": "Korean"},
+            {"code": "cmn", "name": "Chinese (Mandarin)"},
+            {"code": "hin", "name": "Hindi"}
+        ]
+    },
+    "note": "This is a legacy Phase 2 endpoint. Use /docs for full API documentation."
+})
+_LANGUAGES_HEADERS = {
+    "ETag": f'"{hashlib.sha1(_LANGUAGES_PAYLOAD_BYTES).hexdigest()[:16]}"',
+    "Cache-Control": "public, max-age=300"
+}
+
+
+@router.get("/languages")
+async def get_supported_languages(request: Request):
+    """
+    Get list of supported languages for translation.
+    (Legacy Phase 2 endpoint - maintained for compatibility)
+    """
+    if request.headers.get("if-none-match") == _LANGUAGES_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_LANGUAGES_HEADERS)
+    return Response(content=_LANGUAGES_PAYLOAD_BYTES, media_type="application/json", headers=_LANGUAGES_HEADERS)
+
+
+@router.post("/translate")
+async def legacy_translate_video():
+    """
+    Legacy direct translation endpoint from Phase 1/2.
+    
+    **Deprecated**: Use the new job-based API with /api/v1/upload for better
+    async processing, progress tracking, and job management. 
+    Or use the frontend interface at / for a complete user experience.
+    """
+    return ORJSONResponse(
+        status_code=410,
+        content={
+            "error": "Endpoint deprecated",
+            "message": "Direct translation endpoint has been deprecated in Phase 5",
+            "alternatives": {
+                "job_based_api": "Use POST /api/v1/upload for job-based async processing",
+                "frontend_interface": "Use / for complete web interface with drag & drop upload"
+            },
+            "documentation": "/docs",
+            "migration_guide": {
+                "old_flow": "POST /api/v1/translate → immediate response",
+                "new_api_flow": "POST /api/v1/upload → GET /api/v1/jobs/{job_id}/status → GET /api/v1/jobs/{job_id}/download",
+                "new_frontend_flow": "Visit / → upload file → track progress → download result"
+            }
+        }
+    )
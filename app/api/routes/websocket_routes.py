@@ -3,16 +3,16 @@ WebSocket routes for real-time job progress tracking.
 Provides live updates for job status changes and processing progress.
 """
 
-import json
 import asyncio
 import logging
+import orjson
 from typing import Dict, Set
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.models.job_models import ProgressUpdate
-from app.services.database_service import get_database_service
-from app.services.job_queue_service import get_job_queue_service
+from app.models.job_models import ProgressUpdate, encode_progress_message
+from app.services.database_service import DatabaseService, get_database_service
+from app.services.job_queue_service import JobQueueService, get_job_queue_service
 from app.services.util import get_env_var
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,26 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["websockets"])
 
 # WebSocket configuration from environment variables
-WEBSOCKET_PING_INTERVAL = get_env_var("WEBSOCKET_PING_INTERVAL", 30, int)
+WEBSOCKET_PING_INTERVAL = float(get_env_var("WEBSOCKET_PING_INTERVAL", 30, int))
+WEBSOCKET_OUTBOUND_QUEUE_SIZE = get_env_var("WEBSOCKET_OUTBOUND_QUEUE_SIZE", 256, int)
+
+# Keep-alive frames differ only in their timestamp, which is sent with
+# second precision, so each frame is rebuilt at most once per second
+_KEEPALIVE_PREFIXES = {
+    "ping": b'{"type":"ping","timestamp":"',
+    "pong": b'{"type":"pong","timestamp":"',
+}
+_keepalive_cache: Dict[str, tuple] = {}
+
+
+def _keepalive_bytes(message_type: str) -> bytes:
+    """Return the encoded ping/pong frame for the current second."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    cached = _keepalive_cache.get(message_type)
+    if cached is None or cached[0] != now:
+        cached = (now, _KEEPALIVE_PREFIXES[message_type] + now.isoformat().encode() + b'"}')
+        _keepalive_cache[message_type] = cached
+    return cached[1]
 
 
 class WebSocketManager:
@@ -31,7 +50,13 @@ class WebSocketManager:
     def __init__(self):
         # job_id -> set of WebSocket connections
         self.connections: Dict[str, Set[WebSocket]] = {}
-        self.active_connections: Set[WebSocket] = set()
+        # WebSocket -> bounded outbound queue and the task that drains it;
+        # every open connection has exactly one queue, so this also gives
+        # the total connection count
+        self.outbound_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # job_id -> last message queued, so repeated identical updates are dropped
+        self.last_messages: Dict[str, bytes] = {}
     
     async def connect(self, websocket: WebSocket, job_id: str):
         """Accept a WebSocket connection for a specific job."""
@@ -41,75 +66,129 @@ class WebSocketManager:
             self.connections[job_id] = set()
         
         self.connections[job_id].add(websocket)
-        self.active_connections.add(websocket)
         
-        logger.info(f"WebSocket connected for job {job_id} (total connections: {len(self.active_connections)})")
+        self.outbound_queues[websocket] = asyncio.Queue(maxsize=WEBSOCKET_OUTBOUND_QUEUE_SIZE)
+        self.writer_tasks[websocket] = asyncio.create_task(self._writer_loop(websocket, job_id))
+        
+        logger.info(f"WebSocket connected for job {job_id} (total connections: {self.get_connection_count()})")
     
     def disconnect(self, websocket: WebSocket, job_id: str):
         """Remove a WebSocket connection."""
+        # A socket can be dropped by its writer task or by the endpoint's
+        # cleanup, whichever comes first; only the first call does the work
+        if websocket not in self.outbound_queues:
+            return
+        
         if job_id in self.connections:
             self.connections[job_id].discard(websocket)
             
             # Clean up empty job connection sets
             if not self.connections[job_id]:
                 del self.connections[job_id]
+                self.last_messages.pop(job_id, None)
+        
+        # Stop the writer task (unless we are being called from it)
+        del self.outbound_queues[websocket]
+        writer_task = self.writer_tasks.pop(websocket, None)
+        if writer_task and writer_task is not asyncio.current_task():
+            writer_task.cancel()
         
-        self.active_connections.discard(websocket)
+        logger.info(f"WebSocket disconnected for job {job_id} (total connections: {self.get_connection_count()})")
+    
+    async def _writer_loop(self, websocket: WebSocket, job_id: str):
+        """Drain a connection's outbound queue onto its socket."""
+        queue = self.outbound_queues[websocket]
         
-        logger.info(f"WebSocket disconnected for job {job_id} (total connections: {len(self.active_connections)})")
+        try:
+            while True:
+                # Block for the first update, then take whatever else has
+                # queued up meanwhile and send it all as one frame
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                if len(batch) == 1:
+                    await websocket.send_bytes(batch[0])
+                else:
+                    # Messages are already encoded JSON objects, so the
+                    # envelope is assembled without re-serializing them
+                    await websocket.send_bytes(
+                        b'{"type":"progress_batch","data":[' + b",".join(batch) + b"]}"
+                    )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send message to WebSocket for job {job_id}: {e}")
+            self.disconnect(websocket, job_id)
     
     async def send_progress_update(self, job_id: str, progress_update: ProgressUpdate):
-        """Send progress update to all connections for a specific job."""
-        if job_id not in self.connections:
+        """Queue a progress update for all connections for a specific job."""
+        # Encoded once per update and shared by every callback that fans it out
+        self._emit(job_id, progress_update.message_bytes())
+    
+    def _emit(self, job_id: str, message_bytes: bytes):
+        """Queue an encoded message for all connections for a specific job."""
+        job_connections = self.connections.get(job_id)
+        if not job_connections:
             return
         
-        # Convert progress update to JSON
-        message = {
-            "type": "progress_update",
-            "data": {
-                "job_id": progress_update.job_id,
-                "status": progress_update.status,
-                "stage": progress_update.stage,
-                "percentage": progress_update.percentage,
-                "message": progress_update.message,
-                "timestamp": progress_update.timestamp.isoformat(),
-                "estimated_completion": progress_update.estimated_completion.isoformat() if progress_update.estimated_completion else None,
-                "error_details": progress_update.error_details
-            }
-        }
-        
-        message_text = json.dumps(message)
+        # Messages carry second-precision timestamps and are cached by value,
+        # so an update that repeats the previous one within the same second
+        # is the same bytes and has nothing new to tell clients
+        if self.last_messages.get(job_id) == message_bytes:
+            return
+        self.last_messages[job_id] = message_bytes
         
-        # Send to all connections for this job
-        connections_to_remove = []
-        for websocket in self.connections[job_id].copy():
+        # Only enqueue here; each connection's writer task does the network
+        # send, so a slow client never blocks the job that produced the update.
+        # The set is iterated directly and slow clients are dropped afterwards.
+        slow_clients = None
+        for websocket in job_connections:
+            queue = self.outbound_queues.get(websocket)
+            if queue is None:
+                continue
             try:
-                await websocket.send_text(message_text)
-            except Exception as e:
-                logger.warning(f"Failed to send message to WebSocket for job {job_id}: {e}")
-                connections_to_remove.append(websocket)
+                queue.put_nowait(message_bytes)
+            except asyncio.QueueFull:
+                if slow_clients is None:
+                    slow_clients = []
+                slow_clients.append(websocket)
         
-        # Remove failed connections
-        for websocket in connections_to_remove:
-            self.disconnect(websocket, job_id)
+        if slow_clients:
+            for websocket in slow_clients:
+                logger.warning(f"Outbound queue full for WebSocket on job {job_id}, dropping slow client")
+                self.disconnect(websocket, job_id)
+                asyncio.create_task(self._close_quietly(websocket))
+    
+    async def _close_quietly(self, websocket: WebSocket):
+        """Close a WebSocket, ignoring errors from an already-closed socket."""
+        try:
+            await websocket.close(code=1013, reason="Client too slow")
+        except Exception:
+            pass
     
     async def send_job_status_update(self, job_id: str, status: str, message: str = None):
         """Send a job status update to all connections for a specific job."""
-        progress_update = ProgressUpdate(
-            job_id=job_id,
-            status=status,
-            stage=status,
-            percentage=100.0 if status in ["completed", "failed", "cancelled"] else 0.0,
-            message=message or f"Job status changed to {status}"
-        )
-        
-        await self.send_progress_update(job_id, progress_update)
+        # Encoded directly rather than through a validated ProgressUpdate
+        self._emit(job_id, encode_progress_message(
+            job_id,
+            status,
+            status,
+            100.0 if status in ["completed", "failed", "cancelled"] else 0.0,
+            message or f"Job status changed to {status}",
+            datetime.now(timezone.utc).replace(microsecond=0),
+            None,
+            None
+        ))
     
     def get_connection_count(self, job_id: str = None) -> int:
         """Get the number of active connections."""
         if job_id:
             return len(self.connections.get(job_id, set()))
-        return len(self.active_connections)
+        return len(self.outbound_queues)
 
 
 # Global WebSocket manager instance
@@ -158,24 +237,21 @@ async def websocket_job_progress(websocket: WebSocket, job_id: str):
             while True:
                 # Wait for messages from client (for keep-alive or commands)
                 try:
-                    data = await asyncio.wait_for(websocket.receive_text(), timeout=float(WEBSOCKET_PING_INTERVAL))
+                    data = await asyncio.wait_for(receive_message_payload(websocket), timeout=WEBSOCKET_PING_INTERVAL)
                     
                     # Handle client messages
                     try:
-                        message = json.loads(data)
-                        await handle_websocket_message(websocket, job_id, message)
-                    except json.JSONDecodeError:
-                        await websocket.send_text(json.dumps({
+                        message = orjson.loads(data)
+                        await handle_websocket_message(websocket, job_id, db_service, job_queue, message)
+                    except orjson.JSONDecodeError:
+                        await websocket.send_bytes(orjson.dumps({
                             "type": "error",
                             "message": "Invalid JSON format"
                         }))
                         
                 except asyncio.TimeoutError:
                     # Send keep-alive ping
-                    await websocket.send_text(json.dumps({
-                        "type": "ping",
-                        "timestamp": datetime.utcnow().isoformat()
-                    }))
+                    await websocket.send_bytes(_keepalive_bytes("ping"))
                     
         except WebSocketDisconnect:
             logger.info(f"WebSocket client disconnected from job {job_id}")
@@ -192,23 +268,44 @@ async def websocket_job_progress(websocket: WebSocket, job_id: str):
         websocket_manager.disconnect(websocket, job_id)
 
 
-async def handle_websocket_message(websocket: WebSocket, job_id: str, message: dict):
+async def receive_message_payload(websocket: WebSocket):
+    """
+    Receive the raw payload of the next client frame.
+    
+    Binary frames are returned as bytes without any UTF-8 decoding so they
+    can go straight to orjson.loads; text frames from older clients are
+    still accepted.
+    """
+    message = await websocket.receive()
+    
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    
+    data = message.get("bytes")
+    if data is None:
+        data = message.get("text", "")
+    return data
+
+
+async def handle_websocket_message(
+    websocket: WebSocket,
+    job_id: str,
+    db_service: DatabaseService,
+    job_queue: JobQueueService,
+    message: dict
+):
     """Handle incoming WebSocket messages from clients."""
     
     message_type = message.get("type")
     
     if message_type == "ping":
         # Respond to ping with pong
-        await websocket.send_text(json.dumps({
-            "type": "pong",
-            "timestamp": datetime.utcnow().isoformat()
-        }))
+        await websocket.send_bytes(_keepalive_bytes("pong"))
         
     elif message_type == "get_status":
         # Send current job status
         try:
-            db_service = await get_database_service()
-            job = await db_service.get_job(job_id)
+            job = await db_service.get_job_ro(job_id)
             
             if job:
                 response = {
@@ -217,11 +314,11 @@ async def handle_websocket_message(websocket: WebSocket, job_id: str, message: d
                         "job_id": job.id,
                         "status": job.status,
                         "original_filename": job.original_filename,
-                        "progress_stage": job.job_metadata.get("progress_stage") if job.job_metadata else None,
-                        "progress_percentage": job.job_metadata.get("progress_percentage") if job.job_metadata else None,
-                        "created_at": job.created_at.isoformat(),
-                        "updated_at": job.updated_at.isoformat(),
-                        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+                        "progress_stage": job.job_metadata.progress_stage if job.job_metadata else None,
+                        "progress_percentage": job.job_metadata.progress_percentage if job.job_metadata else None,
+                        "created_at": job.created_at,
+                        "updated_at": job.updated_at,
+                        "completed_at": job.completed_at,
                         "error_message": job.error_message
                     }
                 }
@@ -231,10 +328,10 @@ async def handle_websocket_message(websocket: WebSocket, job_id: str, message: d
                     "message": f"Job {job_id} not found"
                 }
                 
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_bytes(orjson.dumps(response))
             
         except Exception as e:
-            await websocket.send_text(json.dumps({
+            await websocket.send_bytes(orjson.dumps({
                 "type": "error",
                 "message": f"Failed to get job status: {str(e)}"
             }))
@@ -242,29 +339,28 @@ async def handle_websocket_message(websocket: WebSocket, job_id: str, message: d
     elif message_type == "cancel_job":
         # Cancel the job
         try:
-            job_queue = get_job_queue_service()
             cancelled = await job_queue.cancel_job(job_id)
             
             if cancelled:
-                await websocket.send_text(json.dumps({
+                await websocket.send_bytes(orjson.dumps({
                     "type": "job_cancelled",
                     "message": f"Job {job_id} cancelled successfully"
                 }))
             else:
-                await websocket.send_text(json.dumps({
+                await websocket.send_bytes(orjson.dumps({
                     "type": "error",
                     "message": f"Failed to cancel job {job_id}"
                 }))
                 
         except Exception as e:
-            await websocket.send_text(json.dumps({
+            await websocket.send_bytes(orjson.dumps({
                 "type": "error",
                 "message": f"Error cancelling job: {str(e)}"
             }))
             
     else:
         # Unknown message type
-        await websocket.send_text(json.dumps({
+        await websocket.send_bytes(orjson.dumps({
             "type": "error",
             "message": f"Unknown message type: {message_type}"
         }))
@@ -279,19 +375,16 @@ async def get_websocket_status():
     """
     
     try:
-        connection_stats = {}
-        total_connections = 0
-        
-        for job_id, connections in websocket_manager.connections.items():
-            connection_count = len(connections)
-            connection_stats[job_id] = connection_count
-            total_connections += connection_count
+        connection_stats = {
+            job_id: len(connections)
+            for job_id, connections in websocket_manager.connections.items()
+        }
         
         return {
-            "total_connections": total_connections,
+            "total_connections": websocket_manager.get_connection_count(),
             "active_job_connections": len(websocket_manager.connections),
             "connections_per_job": connection_stats,
-            "timestamp": datetime.utcnow()
+            "timestamp": datetime.now(timezone.utc)
         }
         
     except Exception as e:
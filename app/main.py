@@ -4,18 +4,20 @@ Complete API implementation with frontend interface for demo.
 """
 
 import os
+import sys
+import time
+import asyncio
 import logging
-from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+import orjson
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-import tempfile
-import shutil
 
 # Phase 3 imports
-from app.api.routes import job_router, websocket_router
+from app.api.routes import job_router, websocket_router, legacy_router
 from app.services.database_service import get_database_service, close_database_service
 from app.services.job_queue_service import get_job_queue_service, shutdown_job_queue_service
 from app.services.translation_service import (
@@ -29,7 +31,7 @@ from app.services.translation_service import (
     ConfigurationError
 )
 from app.services.ai_service_factory import get_ai_factory, ModelLoadingError
-from app.services.util import get_env_var
+from app.services.util import ensure_dir, get_env_var, utcnow_iso
 
 # Configure logging
 logging.basicConfig(
@@ -38,78 +40,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastAPI application
-app = FastAPI(
-    title="AI Video Translation Service",
-    description="""
-    A comprehensive service for translating videos using AI models.
-    
-    **Phase 5 Features:**
-    - Complete web frontend interface
-    - Drag & drop file upload
-    - Real-time progress tracking via WebSocket
-    - Job status management with copyable Job IDs
-    - Video preview and download capabilities
-    - Responsive design for mobile and desktop
-    - Complete job management API with persistence
-    - Async video processing with queue system
-    - Enhanced monitoring and health checks
-    """,
-    version="5.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
 
-# Add CORS middleware for web frontend integration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Keep-alive window for cached models; 0 keeps them until shutdown
+MODEL_KEEP_ALIVE_SECONDS = get_env_var("MODEL_KEEP_ALIVE_SECONDS", 0.0, float)
+MODEL_SWEEP_INTERVAL_SECONDS = 30
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Seconds a translation service health result is reused, so frequent
+# liveness probes share one factory/CUDA inspection
+HEALTH_CACHE_TTL = get_env_var("HEALTH_CACHE_TTL", 2.0, float)
+_translation_health_cache = {"ts": 0.0, "data": None}
+_translation_health_lock = asyncio.Lock()
 
-# Global services (initialized during startup)
-translation_service: Optional[TranslationService] = None
 
+async def _evict_idle_models_periodically(ai_factory):
+    """Background task that evicts models idle for longer than the keep-alive window."""
+    while True:
+        await asyncio.sleep(MODEL_SWEEP_INTERVAL_SECONDS)
+        try:
+            ai_factory.evict_idle_models(MODEL_KEEP_ALIVE_SECONDS)
+        except Exception as e:
+            logger.error(f"Error evicting idle models: {e}")
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize all services on application startup."""
-    global translation_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize all services on startup and clean them up on shutdown.
     
+    Services are created here rather than at import so each worker process
+    builds them after it starts; handlers reach them through app.state.
+    """
     logger.info("Starting AI Video Translation Service Phase 5...")
     
     try:
         # Create necessary directories
-        os.makedirs("uploads", exist_ok=True)
-        os.makedirs(get_env_var("OUTPUT_DIRECTORY", "output/"), exist_ok=True)
-        os.makedirs("static", exist_ok=True)
-        os.makedirs("templates", exist_ok=True)
-        
-        # Initialize database service
-        logger.info("Initializing database service...")
-        db_service = await get_database_service()
-        logger.info("Database service initialized successfully")
+        for directory in ("uploads", get_env_var("OUTPUT_DIRECTORY", "output/"), "static", "templates"):
+            ensure_dir(directory)
         
-        # Initialize AI Service Factory and preload models
-        logger.info("Initializing AI Service Factory...")
+        # Preload default models in the background so the server starts
+        # answering (health reports "warming") while they load
+        logger.info("Initializing database service and AI Service Factory...")
         ai_factory = get_ai_factory()
+        app.state.ai_factory = ai_factory
+        ai_factory.preload_default_models_async()
+        logger.info("Model preloading started in background")
         
-        # Preload default models for better performance
-        try:
-            ai_factory.preload_default_models()
-            logger.info("Model preloading completed")
-        except Exception as e:
-            logger.warning(f"Model preloading failed (will load on-demand): {e}")
+        await get_database_service()
+        logger.info("Database service initialized successfully")
         
         # Initialize translation service
         logger.info("Initializing translation service...")
         translation_service = TranslationService()
+        app.state.translation_service = translation_service
         logger.info("Translation service initialized")
         
         # Initialize job queue service
@@ -118,16 +100,20 @@ async def startup_event():
         job_queue.initialize(translation_service)
         logger.info("Job queue service initialized")
         
+        # Evict models that stay idle past the keep-alive window
+        model_sweeper = None
+        if MODEL_KEEP_ALIVE_SECONDS > 0:
+            model_sweeper = asyncio.create_task(_evict_idle_models_periodically(ai_factory))
+            logger.info(f"Idle models will be evicted after {MODEL_KEEP_ALIVE_SECONDS:.0f}s")
+        
         logger.info("✅ AI Video Translation Service Phase 5 started successfully")
         
     except Exception as e:
         logger.error(f"❌ Failed to start application: {e}")
         raise
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on application shutdown."""
+    
+    yield
+    
     logger.info("Shutting down AI Video Translation Service...")
     
     try:
@@ -139,10 +125,12 @@ async def shutdown_event():
         await close_database_service()
         logger.info("Database service closed")
         
+        if model_sweeper:
+            model_sweeper.cancel()
+        
         # Clear model cache
         try:
-            ai_factory = get_ai_factory()
-            ai_factory.clear_cache()
+            app.state.ai_factory.clear_cache()
             logger.info("Model cache cleared")
         except Exception as e:
             logger.error(f"Error clearing model cache: {e}")
@@ -153,9 +141,56 @@ async def shutdown_event():
         logger.error(f"Error during shutdown: {e}")
 
 
+# Initialize FastAPI application
+app = FastAPI(
+    title="AI Video Translation Service",
+    description="""
+    A comprehensive service for translating videos using AI models.
+    
+    **Phase 5 Features:**
+    - Complete web frontend interface
+    - Drag & drop file upload
+    - Real-time progress tracking via WebSocket
+    - Job status management with copyable Job IDs
+    - Video preview and download capabilities
+    - Responsive design for mobile and desktop
+    - Complete job management API with persistence
+    - Async video processing with queue system
+    - Enhanced monitoring and health checks
+    """,
+    version="5.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Add CORS middleware for web frontend integration
+# CORS_ORIGINS is a comma-separated list; falls back to any origin when unset
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in get_env_var("CORS_ORIGINS", "").split(",")
+    if origin.strip()
+] or ["*"]
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflight responses for a day
+)
+
+# Mount static files and templates
+app.mount("/static", StaticFiles(directory="static"), name="static")
+templates = Jinja2Templates(directory="templates")
+
+
 # Include API routers
 app.include_router(job_router)
 app.include_router(websocket_router)
+app.include_router(legacy_router)
 
 
 # Phase 5: Frontend Routes
@@ -190,82 +225,119 @@ async def frontend_app(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
+# /status payload is static, so it is serialized once at import
+_STATUS_PAYLOAD_BYTES = orjson.dumps({
+    "message": "AI Video Translation Service",
+    "version": "5.0.0",
+    "phase": "Phase 5 - Complete Frontend Interface",
+    "features": [
+        "✅ Complete web frontend interface",
+        "✅ Drag & drop file upload with validation",
+        "✅ Real-time progress tracking via WebSocket",
+        "✅ Job status management with copyable Job IDs",
+        "✅ Video preview and download capabilities",
+        "✅ Responsive design for mobile and desktop",
+        "✅ Job persistence with SQLite in-memory database",
+        "✅ Async video processing with job queue",
+        "✅ File upload and download capabilities",
+        "✅ Model caching and preloading",
+        "✅ Multi-language support (200+ languages)",
+        "✅ Complete job lifecycle management",
+        "✅ Enhanced monitoring and health checks"
+    ],
+    "frontend_urls": {
+        "main_interface": "/",
+        "job_tracking": "/job/{job_id}",
+        "alternative_app": "/app"
+    },
+    "api_documentation": "/docs",
+    "endpoints": {
+        # Core Phase 3 endpoints
+        "upload": "POST /api/v1/upload",
+        "job_status": "GET /api/v1/jobs/{job_id}/status", 
+        "job_status_lite": "GET /api/v1/jobs/{job_id}/status/lite",
+        "download": "GET /api/v1/jobs/{job_id}/download",
+        "preview": "GET /api/v1/jobs/{job_id}/preview",
+        "list_jobs": "GET /api/v1/jobs",
+        "cancel_job": "DELETE /api/v1/jobs/{job_id}",
+        "job_details": "GET /api/v1/jobs/{job_id}",
+        "queue_status": "GET /api/v1/queue/status",
+        
+        # WebSocket endpoints
+        "progress_websocket": "WS /api/v1/jobs/{job_id}/progress",
+        "websocket_status": "GET /api/v1/websocket/status",
+        
+        # Phase 5 Frontend
+        "frontend_home": "GET /",
+        "frontend_job": "GET /job/{job_id}",
+        
+        # Legacy Phase 2 endpoints (still available)
+        "health": "GET /health",
+        "models": "GET /api/v1/models",
+        "languages": "GET /api/v1/languages"
+    },
+    "websocket_support": {
+        "real_time_progress": "WS /api/v1/jobs/{job_id}/progress",
+        "message_types": ["progress_update", "progress_batch", "ping", "pong", "status_response", "error"]
+    },
+    "frontend_features": {
+        "file_upload": "Drag & drop or browse for MP4 files (max 200MB)",
+        "real_time_tracking": "WebSocket-based progress updates",
+        "job_management": "Copyable job IDs, status checking, cancellation",
+        "download_preview": "Video preview and download capabilities",
+        "responsive_design": "Mobile and desktop optimized",
+        "error_handling": "User-friendly error messages and notifications"
+    }
+})
+
+
 @app.get("/status")
 async def root():
     """Root endpoint with comprehensive Phase 5 service information."""
+    return Response(content=_STATUS_PAYLOAD_BYTES, media_type="application/json")
+
+
+async def _not_initialized_health():
+    """Health result for a service that has not been started yet."""
+    return {"status": "not_initialized"}
+
+
+async def _translation_health(translation_service):
+    """Probe the translation service, reusing the result for HEALTH_CACHE_TTL seconds."""
+    async with _translation_health_lock:
+        now = time.monotonic()
+        if _translation_health_cache["data"] is None or now - _translation_health_cache["ts"] >= HEALTH_CACHE_TTL:
+            # The check is synchronous so it runs in a worker thread
+            _translation_health_cache["data"] = await asyncio.to_thread(translation_service.health_check)
+            _translation_health_cache["ts"] = time.monotonic()
+        return _translation_health_cache["data"]
+
+
+async def _database_health():
+    """Probe the database service."""
+    db_service = await get_database_service()
+    return await db_service.health_check()
+
+
+async def _job_queue_health():
+    """Probe the job queue service."""
+    job_queue = get_job_queue_service()
     return {
-        "message": "AI Video Translation Service",
-        "version": "5.0.0",
-        "phase": "Phase 5 - Complete Frontend Interface",
-        "features": [
-            "✅ Complete web frontend interface",
-            "✅ Drag & drop file upload with validation",
-            "✅ Real-time progress tracking via WebSocket",
-            "✅ Job status management with copyable Job IDs",
-            "✅ Video preview and download capabilities",
-            "✅ Responsive design for mobile and desktop",
-            "✅ Job persistence with SQLite in-memory database",
-            "✅ Async video processing with job queue",
-            "✅ File upload and download capabilities",
-            "✅ Model caching and preloading",
-            "✅ Multi-language support (200+ languages)",
-            "✅ Complete job lifecycle management",
-            "✅ Enhanced monitoring and health checks"
-        ],
-        "frontend_urls": {
-            "main_interface": "/",
-            "job_tracking": "/job/{job_id}",
-            "alternative_app": "/app"
-        },
-        "api_documentation": "/docs",
-        "endpoints": {
-            # Core Phase 3 endpoints
-            "upload": "POST /api/v1/upload",
-            "job_status": "GET /api/v1/jobs/{job_id}/status", 
-            "download": "GET /api/v1/jobs/{job_id}/download",
-            "preview": "GET /api/v1/jobs/{job_id}/preview",
-            "list_jobs": "GET /api/v1/jobs",
-            "cancel_job": "DELETE /api/v1/jobs/{job_id}",
-            "job_details": "GET /api/v1/jobs/{job_id}",
-            "queue_status": "GET /api/v1/queue/status",
-            
-            # WebSocket endpoints
-            "progress_websocket": "WS /api/v1/jobs/{job_id}/progress",
-            "websocket_status": "GET /api/v1/websocket/status",
-            
-            # Phase 5 Frontend
-            "frontend_home": "GET /",
-            "frontend_job": "GET /job/{job_id}",
-            
-            # Legacy Phase 2 endpoints (still available)
-            "health": "GET /health",
-            "models": "GET /api/v1/models",
-            "languages": "GET /api/v1/languages"
-        },
-        "websocket_support": {
-            "real_time_progress": "WS /api/v1/jobs/{job_id}/progress",
-            "message_types": ["progress_update", "ping", "pong", "status_response", "error"]
-        },
-        "frontend_features": {
-            "file_upload": "Drag & drop or browse for MP4 files (max 200MB)",
-            "real_time_tracking": "WebSocket-based progress updates",
-            "job_management": "Copyable job IDs, status checking, cancellation",
-            "download_preview": "Video preview and download capabilities",
-            "responsive_design": "Mobile and desktop optimized",
-            "error_handling": "User-friendly error messages and notifications"
-        }
+        "status": "healthy",
+        **job_queue.get_queue_status()
     }
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Comprehensive health check endpoint for Phase 5."""
     try:
+        translation_service = getattr(request.app.state, "translation_service", None)
         health_status = {
             "status": "healthy",
             "version": "5.0.0",
             "phase": "Phase 5",
-            "timestamp": os.popen('date -u +"%Y-%m-%dT%H:%M:%S.%fZ"').read().strip(),
+            "timestamp": utcnow_iso(),
             "frontend": {
                 "status": "active",
                 "static_files": os.path.exists("static"),
@@ -274,37 +346,30 @@ async def health_check():
             }
         }
         
-        # Check translation service
-        if translation_service:
-            translation_health = translation_service.health_check()
-            health_status["translation_service"] = translation_health
-        else:
-            health_status["translation_service"] = {"status": "not_initialized"}
-        
-        # Check database service
-        try:
-            db_service = await get_database_service()
-            db_health = await db_service.health_check()
-            health_status["database_service"] = db_health
-        except Exception as e:
-            health_status["database_service"] = {
-                "status": "unhealthy",
-                "error": str(e)
-            }
+        # Probe the services concurrently
+        translation_probe = (
+            _translation_health(translation_service)
+            if translation_service else _not_initialized_health()
+        )
+        translation_health, db_health, queue_health = await asyncio.gather(
+            translation_probe,
+            _database_health(),
+            _job_queue_health(),
+            return_exceptions=True
+        )
         
-        # Check job queue service
-        try:
-            job_queue = get_job_queue_service()
-            queue_status = job_queue.get_queue_status()
-            health_status["job_queue_service"] = {
-                "status": "healthy",
-                **queue_status
-            }
-        except Exception as e:
-            health_status["job_queue_service"] = {
-                "status": "unhealthy",
-                "error": str(e)
-            }
+        for key, result in (
+            ("translation_service", translation_health),
+            ("database_service", db_health),
+            ("job_queue_service", queue_health)
+        ):
+            if isinstance(result, Exception):
+                health_status[key] = {
+                    "status": "unhealthy",
+                    "error": str(result)
+                }
+            else:
+                health_status[key] = result
         
         # Determine overall health status
         service_statuses = [
@@ -316,19 +381,22 @@ async def health_check():
         if any(status == "unhealthy" for status in service_statuses):
             health_status["status"] = "unhealthy"
             status_code = 503
+        elif any(status == "warming" for status in service_statuses):
+            health_status["status"] = "warming"
+            status_code = 503
         elif any(status == "warning" for status in service_statuses):
             health_status["status"] = "warning"
             status_code = 200
         else:
             status_code = 200
             
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content=health_status
         )
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -340,113 +408,11 @@ async def health_check():
         )
 
 
-@app.get("/api/v1/models")
-async def get_model_status():
-    """
-    Get status information about cached models and AI services.
-    (Legacy Phase 2 endpoint - maintained for compatibility)
-    """
-    try:
-        if translation_service:
-            model_status = translation_service.get_model_status()
-        else:
-            model_status = {"error": "Translation service not initialized"}
-        
-        return {
-            "status": "success",
-            "timestamp": os.popen('date -u +"%Y-%m-%dT%H:%M:%S.%fZ"').read().strip(),
-            "model_cache": model_status,
-            "note": "This is a legacy Phase 2 endpoint. Use /health for comprehensive status."
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get model status: {str(e)}"
-        )
-
-
-@app.get("/api/v1/languages")
-async def get_supported_languages():
-    """
-    Get list of supported languages for translation.
-    (Legacy Phase 2 endpoint - maintained for compatibility)
-    """
-    try:
-        # Basic language support - simplified for Phase 5
-        languages = {
-            "source_languages": [
-                {"code": "eng", "name": "English"},
-                {"code": "spa", "name": "Spanish"},
-                {"code": "fra", "name": "French"},
-                {"code": "deu", "name": "German"},
-                {"code": "ita", "name": "Italian"},
-                {"code": "por", "name": "Portuguese"},
-                {"code": "jpn", "name": "Japanese"},
-                {"code": "kor", "name": "Korean"},
-                {"code": "cmn", "name": "Chinese (Mandarin)"},
-                {"code": "hin", "name": "Hindi"}
-            ],
-            "target_languages": [
-                {"code": "eng", "name": "English"},
-                {"code": "spa", "name": "Spanish"},
-                {"code": "fra", "name": "French"},
-                {"code": "deu", "name": "German"},
-                {"code": "ita", "name": "Italian"},
-                {"code": "por", "name": "Portuguese"},
-                {"code": "jpn", "name": "Japanese"},
-                {"code": "kor", "name": "Korean"},
-                {"code": "cmn", "name": "Chinese (Mandarin)"},
-                {"code": "hin", "name": "Hindi"}
-            ]
-        }
-        
-        return {
-            "status": "success",
-            "languages": languages,
-            "note": "This is a legacy Phase 2 endpoint. Use /docs for full API documentation."
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get supported languages: {str(e)}"
-        )
-
-
-@app.post("/api/v1/translate")
-async def legacy_translate_video():
-    """
-    Legacy direct translation endpoint from Phase 1/2.
-    
-    **Deprecated**: Use the new job-based API with /api/v1/upload for better
-    async processing, progress tracking, and job management. 
-    Or use the frontend interface at / for a complete user experience.
-    """
-    return JSONResponse(
-        status_code=410,
-        content={
-            "error": "Endpoint deprecated",
-            "message": "Direct translation endpoint has been deprecated in Phase 5",
-            "alternatives": {
-                "job_based_api": "Use POST /api/v1/upload for job-based async processing",
-                "frontend_interface": "Use / for complete web interface with drag & drop upload"
-            },
-            "documentation": "/docs",
-            "migration_guide": {
-                "old_flow": "POST /api/v1/translate → immediate response",
-                "new_api_flow": "POST /api/v1/upload → GET /api/v1/jobs/{job_id}/status → GET /api/v1/jobs/{job_id}/download",
-                "new_frontend_flow": "Visit / → upload file → track progress → download result"
-            }
-        }
-    )
-
-
 # Global exception handlers
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Custom 404 handler with helpful information."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
@@ -462,7 +428,7 @@ async def not_found_handler(request, exc):
 async def internal_error_handler(request, exc):
     """Custom 500 handler with service information."""
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -488,5 +454,8 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # uvloop is not available on Windows; uvicorn falls back to asyncio there
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools"
     )
\ No newline at end of file
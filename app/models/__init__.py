@@ -10,14 +10,16 @@ from .job_models import (
     JobResponse,
     JobUpdate,
     ProgressUpdate,
-    JobMetadata
+    JobMetadata,
+    EngineConfig
 )
 
 from .translation_models import (
     TranslationRequest,
     TranslationResult,
     UploadRequest,
-    UploadResponse
+    UploadResponse,
+    ModelPreloadRequest
 )
 
 __all__ = [
@@ -29,10 +31,12 @@ __all__ = [
     "JobUpdate",
     "ProgressUpdate",
     "JobMetadata",
+    "EngineConfig",
     
     # Translation models
     "TranslationRequest",
     "TranslationResult", 
     "UploadRequest",
-    "UploadResponse"
+    "UploadResponse",
+    "ModelPreloadRequest"
 ] 
\ No newline at end of file
@@ -2,19 +2,78 @@
 Pydantic models for job management and tracking.
 """
 
-from typing import Optional, Dict, Any, Literal
-from datetime import datetime
-from pydantic import BaseModel, Field
-import uuid
+from typing import Annotated, Optional, Dict, Any
+from enum import Enum
+from functools import lru_cache, partial
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, StringConstraints
+from fastapi.responses import Response
+import orjson
+import secrets
 
 
-class JobStatus(BaseModel):
+def utcnow() -> datetime:
+    """Timezone-aware current UTC time, used as the timestamp default factory."""
+    return datetime.now(timezone.utc)
+
+
+# ISO 639-3 language codes are three lowercase letters; pydantic-core checks
+# the pattern itself, so malformed codes are rejected at the edge
+ISO_639_3_PATTERN = r"^[a-z]{3}$"
+LanguageCode = Annotated[str, StringConstraints(pattern=ISO_639_3_PATTERN)]
+
+
+# Field types shared by the job and response models, so each description is
+# declared (and its FieldInfo allocated) once rather than per class
+OriginalFilename = Annotated[str, Field(description="Original filename of uploaded video")]
+InputFileSize = Annotated[int, Field(description="Size of input file in bytes")]
+ProcessingTimeSeconds = Annotated[Optional[int], Field(description="Total processing time in seconds")]
+ErrorMessage = Annotated[Optional[str], Field(description="Error message if job failed")]
+CompletedAt = Annotated[Optional[datetime], Field(description="Job completion timestamp")]
+
+
+class ResponseModel(BaseModel):
+    """
+    Base class for API response models that endpoints return as ready responses.
+    
+    Returning the Response directly skips FastAPI's response_model validation
+    and jsonable_encoder pass; response_model is still declared on the route
+    for the OpenAPI schema.
+    """
+    
+    def as_response(self, exclude_none: bool = False, headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Serialize this model into a JSON response.
+        
+        model_dump_json() writes the JSON bytes straight from pydantic-core,
+        without building an intermediate dict for a second serializer.
+        """
+        return Response(
+            content=self.model_dump_json(exclude_none=exclude_none),
+            media_type="application/json",
+            headers=headers
+        )
+
+
+class JobStatus(str, Enum):
     """Enumeration of possible job statuses."""
-    UPLOADED: Literal["uploaded"] = "uploaded"
-    PROCESSING: Literal["processing"] = "processing" 
-    COMPLETED: Literal["completed"] = "completed"
-    FAILED: Literal["failed"] = "failed"
-    CANCELLED: Literal["cancelled"] = "cancelled"
+    UPLOADED = "uploaded"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+class EngineConfig(BaseModel):
+    """Engine and model selection shared by upload, job and translation models."""
+    stt_engine: str = Field("auto", description="Speech-to-text engine (auto, faster-whisper, transformers)")
+    stt_model: str = Field("medium", description="Whisper model size (medium, large-v2, large-v3)")
+    translation_engine: str = Field("nllb", description="Translation engine (nllb)")
+    translation_model: str = Field("nllb-200-1.3B", description="NLLB model size (nllb-200-1.3B)")
+    tts_engine: str = Field("mms", description="Text-to-speech engine (mms)")
 
 
 class JobMetadata(BaseModel):
@@ -39,20 +98,13 @@ class JobMetadata(BaseModel):
     progress_percentage: Optional[float] = None
 
 
-class JobCreate(BaseModel):
+class JobCreate(EngineConfig):
     """Model for creating a new job."""
-    original_filename: str = Field(..., description="Original filename of uploaded video")
+    original_filename: OriginalFilename
     source_language: Optional[str] = Field(None, description="Source language code (auto-detected if not provided)")
-    target_language: str = Field(..., description="Target language code for translation")
+    target_language: LanguageCode = Field(..., description="Target language code for translation")
     input_file_path: str = Field(..., description="Path to uploaded input file")
-    input_file_size: int = Field(..., description="Size of input file in bytes")
-    
-    # Translation parameters
-    stt_engine: str = Field("auto", description="Speech-to-text engine")
-    stt_model: str = Field("medium", description="STT model name")
-    translation_engine: str = Field("nllb", description="Translation engine")
-    translation_model: str = Field("nllb-200-1.3B", description="Translation model name")
-    tts_engine: str = Field("mms", description="Text-to-speech engine")
+    input_file_size: InputFileSize
     
     # Optional metadata
     job_metadata: Optional[JobMetadata] = None
@@ -60,7 +112,7 @@ class JobCreate(BaseModel):
 
 class JobUpdate(BaseModel):
     """Model for updating job fields."""
-    status: Optional[str] = None
+    status: Optional[JobStatus] = None
     source_language: Optional[str] = None
     output_file_path: Optional[str] = None
     output_file_size: Optional[int] = None
@@ -70,46 +122,74 @@ class JobUpdate(BaseModel):
     completed_at: Optional[datetime] = None
 
 
-class Job(BaseModel):
+class Job(EngineConfig):
     """Complete job model with all fields."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique job identifier")
-    original_filename: str = Field(..., description="Original filename of uploaded video")
+    id: str = Field(default_factory=partial(secrets.token_hex, 16), description="Unique job identifier")
+    original_filename: OriginalFilename
     source_language: Optional[str] = Field(None, description="Source language code")
-    target_language: str = Field(..., description="Target language code for translation")
-    status: str = Field("uploaded", description="Current job status")
+    target_language: LanguageCode = Field(..., description="Target language code for translation")
+    status: JobStatus = Field(JobStatus.UPLOADED, description="Current job status")
     
     # File paths and sizes
     input_file_path: str = Field(..., description="Path to input file")
     output_file_path: Optional[str] = Field(None, description="Path to output file")
-    input_file_size: int = Field(..., description="Size of input file in bytes")
+    input_file_size: InputFileSize
     output_file_size: Optional[int] = Field(None, description="Size of output file in bytes")
     
     # Processing information
-    processing_time_seconds: Optional[int] = Field(None, description="Total processing time in seconds")
-    error_message: Optional[str] = Field(None, description="Error message if job failed")
-    
-    # Translation parameters
-    stt_engine: str = Field("auto", description="Speech-to-text engine")
-    stt_model: str = Field("medium", description="STT model name")
-    translation_engine: str = Field("nllb", description="Translation engine")
-    translation_model: str = Field("nllb-200-1.3B", description="Translation model name")
-    tts_engine: str = Field("mms", description="Text-to-speech engine")
+    processing_time_seconds: ProcessingTimeSeconds = None
+    error_message: ErrorMessage = None
     
     # Metadata and timestamps
-    job_metadata: Optional[Dict[str, Any]] = Field(None, description="Additional job metadata")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation timestamp")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
-    completed_at: Optional[datetime] = Field(None, description="Job completion timestamp")
+    job_metadata: Optional[JobMetadata] = Field(None, description="Additional job metadata")
+    created_at: datetime = Field(default_factory=utcnow, description="Job creation timestamp")
+    updated_at: datetime = Field(default_factory=utcnow, description="Last update timestamp")
+    completed_at: CompletedAt = None
+    
+    # Serialized details payload, cached once the job reaches a terminal state
+    details_json: Optional[str] = Field(None, description="Cached JSON job details for terminal jobs")
+    
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "Job":
+        """
+        Build a Job from a database row already converted to native types.
+        
+        Rows were validated when they were written, so this uses
+        model_construct() and skips validation.
+        """
+        return cls.model_construct(**row)
     
-    class Config:
-        from_attributes = True
+    def details_dict(self) -> Dict[str, Any]:
+        """Return the complete job information served by the job details endpoint."""
+        return {
+            "id": self.id,
+            "original_filename": self.original_filename,
+            "source_language": self.source_language,
+            "target_language": self.target_language,
+            "status": self.status,
+            "input_file_path": self.input_file_path,
+            "output_file_path": self.output_file_path,
+            "input_file_size": self.input_file_size,
+            "output_file_size": self.output_file_size,
+            "processing_time_seconds": self.processing_time_seconds,
+            "error_message": self.error_message,
+            "stt_engine": self.stt_engine,
+            "stt_model": self.stt_model,
+            "translation_engine": self.translation_engine,
+            "translation_model": self.translation_model,
+            "tts_engine": self.tts_engine,
+            "job_metadata": self.job_metadata.model_dump() if self.job_metadata else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "completed_at": self.completed_at
+        }
 
 
-class JobResponse(BaseModel):
+class JobResponse(ResponseModel):
     """API response model for job information."""
     job_id: str = Field(..., description="Unique job identifier")
-    status: str = Field(..., description="Current job status")
-    original_filename: str = Field(..., description="Original filename")
+    status: JobStatus = Field(..., description="Current job status")
+    original_filename: OriginalFilename
     source_language: Optional[str] = Field(None, description="Source language")
     target_language: str = Field(..., description="Target language")
     
@@ -118,32 +198,110 @@ class JobResponse(BaseModel):
     progress_percentage: Optional[float] = Field(None, description="Progress percentage (0-100)")
     
     # File information
-    input_file_size: int = Field(..., description="Input file size in bytes")
+    input_file_size: InputFileSize
     output_file_size: Optional[int] = Field(None, description="Output file size in bytes")
     
     # Processing information
-    processing_time_seconds: Optional[int] = Field(None, description="Processing time in seconds")
-    error_message: Optional[str] = Field(None, description="Error message if failed")
+    processing_time_seconds: ProcessingTimeSeconds = None
+    error_message: ErrorMessage = None
     
     # Timestamps
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
-    completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    completed_at: CompletedAt = None
     
     # Download URLs (populated by API)
     download_url: Optional[str] = Field(None, description="Download URL for completed job")
     preview_url: Optional[str] = Field(None, description="Preview URL for job")
+    
+    @classmethod
+    def from_job(cls, job: Job, download_url: Optional[str] = None, preview_url: Optional[str] = None) -> "JobResponse":
+        """Build the API response for a job without revalidating its already-typed fields."""
+        progress_stage = None
+        progress_percentage = None
+        
+        if job.job_metadata:
+            progress_stage = job.job_metadata.progress_stage
+            progress_percentage = job.job_metadata.progress_percentage
+        
+        return cls.model_construct(
+            job_id=job.id,
+            status=job.status,
+            original_filename=job.original_filename,
+            source_language=job.source_language,
+            target_language=job.target_language,
+            progress_stage=progress_stage,
+            progress_percentage=progress_percentage,
+            input_file_size=job.input_file_size,
+            output_file_size=job.output_file_size,
+            processing_time_seconds=job.processing_time_seconds,
+            error_message=job.error_message,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            completed_at=job.completed_at,
+            download_url=download_url,
+            preview_url=preview_url
+        )
 
 
 class ProgressUpdate(BaseModel):
     """Model for real-time progress updates via WebSocket."""
     job_id: str = Field(..., description="Job identifier")
-    status: str = Field(..., description="Current status")
+    status: JobStatus = Field(..., description="Current status")
     stage: str = Field(..., description="Current processing stage")
     percentage: float = Field(0.0, description="Progress percentage (0-100)")
     message: Optional[str] = Field(None, description="Progress message")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Update timestamp")
+    timestamp: datetime = Field(default_factory=utcnow, description="Update timestamp")
     
     # Optional detailed information
     estimated_completion: Optional[datetime] = Field(None, description="Estimated completion time")
-    error_details: Optional[str] = Field(None, description="Error details if applicable") 
\ No newline at end of file
+    error_details: Optional[str] = Field(None, description="Error details if applicable")
+
+    # Immutable, so the encoded message cached below can never go stale
+    model_config = ConfigDict(frozen=True)
+
+    _cached_bytes: Optional[bytes] = PrivateAttr(default=None)
+
+    def message_bytes(self) -> bytes:
+        """Return the encoded WebSocket message, serializing only on first use."""
+        if self._cached_bytes is None:
+            # Timestamps are sent with second precision so identical updates
+            # issued within the same second share one cached encoding
+            self._cached_bytes = encode_progress_message(
+                self.job_id,
+                self.status,
+                self.stage,
+                self.percentage,
+                self.message,
+                self.timestamp.replace(microsecond=0),
+                self.estimated_completion,
+                self.error_details
+            )
+        return self._cached_bytes
+
+
+@lru_cache(maxsize=1024)
+def encode_progress_message(
+    job_id: str,
+    status: str,
+    stage: str,
+    percentage: float,
+    message: Optional[str],
+    timestamp: datetime,
+    estimated_completion: Optional[datetime],
+    error_details: Optional[str]
+) -> bytes:
+    """Encode a progress_update WebSocket message."""
+    return orjson.dumps({
+        "type": "progress_update",
+        "data": {
+            "job_id": job_id,
+            "status": status,
+            "stage": stage,
+            "percentage": percentage,
+            "message": message,
+            "timestamp": timestamp,
+            "estimated_completion": estimated_completion,
+            "error_details": error_details
+        }
+    })
@@ -2,25 +2,32 @@
 Pydantic models for translation requests and responses.
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List, FrozenSet
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from datetime import datetime
 
+from app.models.job_models import (
+    CompletedAt,
+    EngineConfig,
+    ErrorMessage,
+    LanguageCode,
+    OriginalFilename,
+    ProcessingTimeSeconds,
+    ResponseModel,
+    utcnow
+)
 
-class UploadRequest(BaseModel):
+
+class UploadRequest(EngineConfig):
     """Model for file upload request parameters."""
-    target_language: str = Field(..., description="Target language for translation (ISO 639-3 code)")
+    target_language: LanguageCode = Field(..., description="Target language for translation (ISO 639-3 code)")
     source_language: Optional[str] = Field(None, description="Source language (auto-detect if not provided)")
     
-    # Engine configuration
-    stt_engine: str = Field("auto", description="Speech-to-text engine (auto, faster-whisper, transformers)")
-    stt_model: str = Field("medium", description="Whisper model size (medium, large-v2, large-v3)")
-    translation_engine: str = Field("nllb", description="Translation engine (nllb)")
-    translation_model: str = Field("nllb-200-1.3B", description="NLLB model size (nllb-200-1.3B)")
-    tts_engine: str = Field("mms", description="Text-to-speech engine (mms)")
+    # Not used on any request path, so build the validator only on first use
+    model_config = ConfigDict(defer_build=True)
 
 
-class UploadResponse(BaseModel):
+class UploadResponse(ResponseModel):
     """Response model for successful file upload."""
     job_id: str = Field(..., description="Unique job identifier for tracking")
     status: str = Field("uploaded", description="Initial job status")
@@ -36,29 +43,23 @@ class UploadResponse(BaseModel):
     processing_config: Dict[str, Any] = Field(..., description="Configuration used for processing")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Upload timestamp")
+    created_at: datetime = Field(default_factory=utcnow, description="Upload timestamp")
+    
+    model_config = ConfigDict(frozen=True)
 
 
-class TranslationRequest(BaseModel):
+class TranslationRequest(EngineConfig):
     """Model for translation request (used internally by services)."""
     source_language: Optional[str] = None
-    target_language: str
+    target_language: LanguageCode
     input_file_path: str
     output_file_path: str
     
-    # Engine configuration
-    stt_engine: str = "auto"
-    stt_model: str = "medium"
-    translation_engine: str = "nllb"
-    translation_model: str = "nllb-200-1.3B"
-    tts_engine: str = "mms"
-    
     # Processing options
     device: Optional[str] = None
     cpu_threads: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True)
 
 
 class TranslationResult(BaseModel):
@@ -75,22 +76,81 @@ class TranslationResult(BaseModel):
     # Processing metadata
     metadata: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
 
+class JobSummary(BaseModel):
+    """Summary of a job as returned by the job listing endpoint."""
+    job_id: str = Field(..., description="Unique job identifier")
+    status: str = Field(..., description="Current job status")
+    original_filename: OriginalFilename
+    source_language: Optional[str] = Field(None, description="Source language")
+    target_language: str = Field(..., description="Target language")
+    file_size: int = Field(..., description="Input file size in bytes")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    completed_at: CompletedAt = None
+    processing_time_seconds: ProcessingTimeSeconds = None
+    error_message: ErrorMessage = None
 
-class JobListResponse(BaseModel):
-    """Response model for listing jobs."""
-    jobs: List[Dict[str, Any]] = Field(..., description="List of jobs")
+
+class JobListResponse(ResponseModel):
+    """
+    Response model for listing jobs.
+    
+    The /jobs endpoint serializes summary rows straight from the database
+    cursor; this model documents that shape for the OpenAPI schema.
+    """
+    jobs: List[JobSummary] = Field(..., description="List of jobs")
     total_count: int = Field(..., description="Total number of jobs")
     page: int = Field(1, description="Current page number")
     page_size: int = Field(50, description="Number of jobs per page")
     
     
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Standard error response model."""
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
-    request_id: Optional[str] = Field(None, description="Request identifier for tracking") 
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=utcnow, description="Error timestamp")
+    request_id: Optional[str] = Field(None, description="Request identifier for tracking")
+    
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+_WHISPER_MODELS = frozenset({
+    "tiny", "tiny.en", "base", "base.en", "small", "small.en", "medium", "medium.en",
+    "large-v1", "large-v2", "large-v3"
+})
+
+# Model names that may be preloaded, per model type
+PRELOADABLE_MODELS: Dict[str, FrozenSet[str]] = {
+    "stt_whisper": _WHISPER_MODELS,
+    "stt_whisper_transformers": _WHISPER_MODELS,
+    "translation_nllb": frozenset({
+        "nllb-200-distilled-600M", "nllb-200-distilled-1.3B", "nllb-200-1.3B", "nllb-200-3.3B"
+    }),
+    "tts_mms": frozenset({"mms"})
+}
+
+MAX_PRELOAD_MODELS = 8
+
+
+class ModelPreloadSpec(BaseModel):
+    """A single model to load into the model cache."""
+    model_type: str = Field(..., description="Model type (stt_whisper, stt_whisper_transformers, translation_nllb, tts_mms)")
+    model_name: str = Field(..., description="Model name (e.g. tiny, nllb-200-distilled-600M, mms)")
+    
+    @model_validator(mode="after")
+    def check_supported(self) -> "ModelPreloadSpec":
+        supported = PRELOADABLE_MODELS.get(self.model_type)
+        if supported is None:
+            raise ValueError(f"Unsupported model type: {self.model_type}")
+        if self.model_name not in supported:
+            raise ValueError(f"Unsupported {self.model_type} model: {self.model_name}")
+        return self
+
+
+class ModelPreloadRequest(BaseModel):
+    """Request model for preloading models into the cache."""
+    models: List[ModelPreloadSpec] = Field(..., max_length=MAX_PRELOAD_MODELS, description="Models to preload")
@@ -6,24 +6,23 @@ for all AI services (STT, TTS, Translation). Models are loaded once at startup a
 in memory for reuse across requests.
 """
 
+import logging
 import os
 import sys
 import time
 import threading
-from typing import Dict, Optional, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 
-import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, VitsModel
-from faster_whisper import WhisperModel
-
+# torch, transformers, faster_whisper and the service classes built on them
+# are imported inside the methods that need them: each takes seconds to
+# import, and most processes only ever use some of them.
 from app import logger
 from app.services.util import get_env_var
-from app.services.stt.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
-from app.services.stt.speech_to_text_whisper_transformers import SpeechToTextWhisperTransformers
-from app.services.tts.text_to_speech_mms import TextToSpeechMMS
-from app.services.translation.translation_nllb import TranslationNLLB
 
 
 class ModelType(Enum):
@@ -34,19 +33,32 @@ class ModelType(Enum):
     TRANSLATION_NLLB = "translation_nllb"
 
 
-@dataclass
+# Upper bound on models loaded in parallel by _load_models_concurrently()
+MAX_PRELOAD_WORKERS = 4
+
+# (model_type, model_name, device, cpu_threads, vad)
+CacheKey = Tuple[ModelType, str, str, int, bool]
+
+
+def format_cache_key(cache_key: CacheKey) -> str:
+    """Render a cache key as a readable string for logs and status output."""
+    model_type, *rest = cache_key
+    return "_".join([model_type.value, *map(str, rest)])
+
+
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for model loading and caching."""
     model_type: ModelType
     model_name: str
     device: str
-    cache_key: str
+    cache_key: Optional[CacheKey]
     cpu_threads: int = 0
     vad: bool = False
     compute_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedModel:
     """Container for cached model data."""
     model: Any
@@ -54,6 +66,7 @@ class CachedModel:
     config: Optional[ModelConfig] = None
     load_time: float = 0.0
     memory_usage_mb: Optional[float] = None
+    last_used: float = 0.0
 
 
 class ModelLoadingError(Exception):
@@ -65,38 +78,69 @@ class AIServiceFactory:
     """
     Factory for creating and managing AI services with model caching.
     
-    This singleton class manages model loading, caching, and service creation
+    This class manages model loading, caching, and service creation
     to optimize performance and resource usage across the application.
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
         """Initialize the AI Service Factory."""
-        if not hasattr(self, '_initialized'):
-            self._model_cache: Dict[str, CachedModel] = {}
-            self._device = get_env_var("DEVICE", "cpu", str, ["cpu", "cuda"])
-            self._cpu_threads = get_env_var("CPU_THREADS", 0, int)
-            self._vad = get_env_var("VAD", False, bool)
-            self._hugging_face_token = self._get_hugging_face_token()
-            self._cache_enabled = get_env_var("MODEL_CACHE_ENABLED", True, bool)
-            self._preload_models = get_env_var("PRELOAD_MODELS", False, bool)
-            self._initialized = True
-            
-            # Platform-specific optimizations
-            if sys.platform == "darwin":
-                os.environ["TOKENIZERS_PARALLELISM"] = "false"
-            
-            logger().info("AI Service Factory initialized")
+        # Kept in least- to most-recently-used order
+        self._model_cache: "OrderedDict[CacheKey, CachedModel]" = OrderedDict()
+        # One lock per cache key, so concurrent jobs needing the same cold
+        # model wait for a single load instead of each loading a copy
+        self._load_locks: Dict[CacheKey, threading.Lock] = {}
+        self._load_locks_guard = threading.Lock()
+        # Guards _model_cache mutations, which can come from several
+        # loader threads at once during preloading
+        self._cache_lock = threading.Lock()
+        # Cleared while preload_default_models_async() is still loading
+        self._preload_done = threading.Event()
+        self._preload_done.set()
+        # language -> (VitsModel, tokenizer), least- to most-recently-used,
+        # see get_mms_vits()
+        self._mms_models: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+        self._mms_max = get_env_var("MMS_MAX_CACHED_LANGS", 4, int)
+        # Per-language counterpart of _load_locks for get_mms_vits()
+        self._mms_load_locks: Dict[str, threading.Lock] = {}
+        # (model_type, model_name) -> ModelConfig, see _model_config()
+        self._model_configs: Dict[Tuple[ModelType, str], ModelConfig] = {}
+        self._max_cached_models = get_env_var("MODEL_CACHE_MAX_MODELS", 0, int)
+        self._device = get_env_var("DEVICE", "cpu", str, ["cpu", "cuda"])
+        self._cpu_threads = get_env_var("CPU_THREADS", 0, int)
+        self._vad = get_env_var("VAD", False, bool)
+        self._whisper_compute_type = get_env_var("WHISPER_COMPUTE_TYPE", "", str)
+        self._hugging_face_token = self._get_hugging_face_token()
+        self._process = self._get_process()
+        self._cache_enabled = get_env_var("MODEL_CACHE_ENABLED", True, bool)
+        self._preload_models = get_env_var("PRELOAD_MODELS", False, bool)
+        self._preload_share_memory = get_env_var("PRELOAD_SHARE_MEMORY", False, bool)
+        self._local_files_only = get_env_var("HF_OFFLINE", False, bool)
+        self._nllb_int8 = get_env_var("NLLB_INT8", False, bool)
+        self._nllb_fp16 = get_env_var("NLLB_FP16", False, bool)
+        self._nllb_compile = get_env_var("NLLB_COMPILE", False, bool)
+        # Settings reported by get_model_status never change after init
+        self._static_status = {
+            "cache_enabled": self._cache_enabled,
+            "preload_enabled": self._preload_models,
+            "device": self._device,
+            "cpu_threads": self._cpu_threads
+        }
+        
+        # Platform-specific optimizations
+        if sys.platform == "darwin":
+            os.environ["TOKENIZERS_PARALLELISM"] = "false"
+        
+        # Expandable segments keep the CUDA caching allocator from fragmenting
+        # as models are loaded and evicted; it is read at the first CUDA
+        # allocation, which always comes after this (torch is imported lazily)
+        if self._device == "cuda":
+            os.environ.setdefault(
+                "PYTORCH_CUDA_ALLOC_CONF",
+                "expandable_segments:True,max_split_size_mb:128,garbage_collection_threshold:0.8"
+            )
+        self._cuda_snapshot_path = get_env_var("CUDA_MEMORY_SNAPSHOT", "", str)
+        
+        logger().info("AI Service Factory initialized")
     
     def _get_hugging_face_token(self) -> str:
         """Get Hugging Face token from environment variables."""
@@ -105,18 +149,85 @@ class AIServiceFactory:
             logger().warning("No Hugging Face token found. Some models may not load properly.")
         return token
     
-    def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
+    def _get_process(self) -> Optional[Any]:
+        """Get a psutil handle on the current process, or None without psutil."""
         try:
             import psutil
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss / 1024 / 1024
+            return psutil.Process(os.getpid())
         except ImportError:
+            return None
+    
+    def _get_memory_usage(self) -> float:
+        """Get current memory usage in MB."""
+        if self._process is None:
             return 0.0
+        # Re-resolve after a fork so workers report their own memory
+        if self._process.pid != os.getpid():
+            self._process = self._get_process()
+        return self._process.memory_info().rss / 1048576
     
-    def _get_cache_key(self, config: ModelConfig) -> str:
+    def _model_config(self, model_type: ModelType, model_name: str) -> ModelConfig:
+        """
+        Return the (memoized) configuration for a model, with its cache key.
+        
+        Configs depend only on the model and settings fixed at init, so each
+        is built once and reused by every later service request.
+        """
+        config = self._model_configs.get((model_type, model_name))
+        if config is None:
+            config = ModelConfig(
+                model_type=model_type,
+                model_name=model_name,
+                device=self._device,
+                cache_key=None
+            )
+            if model_type in (ModelType.STT_WHISPER, ModelType.STT_WHISPER_TRANSFORMERS):
+                config.cpu_threads = self._cpu_threads
+            if model_type == ModelType.STT_WHISPER:
+                config.vad = self._vad
+                config.compute_type = self._whisper_compute_type or self._default_whisper_compute_type()
+            config.cache_key = self._get_cache_key(config)
+            self._model_configs[(model_type, model_name)] = config
+        return config
+    
+    def _default_whisper_compute_type(self) -> str:
+        """
+        Pick the fastest CTranslate2 compute type supported by the device.
+        
+        int8 weights with FP16 activations on Volta or newer GPUs, bfloat16 on
+        CPUs with AVX-512 BF16 support, otherwise the previous float16/int8.
+        """
+        if self._device == "cuda":
+            import torch
+            if torch.cuda.is_available() and torch.cuda.get_device_capability()[0] >= 7:
+                return "int8_float16"
+            return "float16"
+        
+        try:
+            with open("/proc/cpuinfo") as cpuinfo:
+                if "avx512_bf16" in cpuinfo.read():
+                    return "bfloat16"
+        except OSError:
+            pass
+        return "int8"
+    
+    def _from_pretrained(self, loader: Any, model_name: str) -> Any:
+        """
+        Call loader.from_pretrained, skipping Hub lookups when HF_OFFLINE is set.
+        
+        Falls back to a normal (downloading) load if the files are not in the
+        local cache yet, e.g. on the first run.
+        """
+        if self._local_files_only:
+            try:
+                return loader.from_pretrained(model_name, local_files_only=True)
+            except OSError:
+                logger().info(f"{model_name} not in local cache, downloading it")
+        return loader.from_pretrained(model_name)
+    
+    def _get_cache_key(self, config: ModelConfig) -> CacheKey:
         """Generate a unique cache key for the model configuration."""
-        return f"{config.model_type.value}_{config.model_name}_{config.device}_{config.cpu_threads}_{config.vad}"
+        return (config.model_type, config.model_name, config.device, config.cpu_threads, config.vad)
     
     def _load_whisper_model(self, config: ModelConfig) -> CachedModel:
         """Load and cache a Whisper model."""
@@ -125,7 +236,10 @@ class AIServiceFactory:
         start_memory = self._get_memory_usage()
         
         try:
-            compute_type = "float16" if config.device == "cuda" else "int8"
+            from faster_whisper import WhisperModel
+            
+            compute_type = config.compute_type or ("float16" if config.device == "cuda" else "int8")
+            logger().info(f"Whisper compute type: {compute_type}")
             model = WhisperModel(
                 model_size_or_path=config.model_name,
                 device=config.device,
@@ -182,21 +296,43 @@ class AIServiceFactory:
         start_memory = self._get_memory_usage()
         
         try:
+            import torch
+            from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+            
             model_name = f"facebook/{config.model_name}"
             
             # Load tokenizer
-            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            tokenizer = self._from_pretrained(AutoTokenizer, model_name)
             
             # Load model with device fallback
             try:
-                model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(config.device)
+                model = self._from_pretrained(AutoModelForSeq2SeqLM, model_name).to(config.device)
+                device = config.device
             except RuntimeError as e:
                 if config.device == "cuda":
                     logger().warning(f"Loading NLLB model {model_name} on CPU due to GPU error")
-                    model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to("cpu")
+                    model = self._from_pretrained(AutoModelForSeq2SeqLM, model_name).to("cpu")
+                    device = "cpu"
                 else:
                     raise e
             
+            # Inference only: no dropout, no autograd bookkeeping
+            model.eval()
+            model.requires_grad_(False)
+            
+            # Reduced precision: int8 Linear weights on CPU, FP16 on GPU
+            if device == "cpu" and self._nllb_int8:
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger().info(f"Quantized NLLB model {model_name} to int8")
+            elif device == "cuda" and self._nllb_fp16:
+                model = model.half()
+                logger().info(f"Converted NLLB model {model_name} to FP16")
+            
+            if self._nllb_compile:
+                self._compile_nllb_model(model, tokenizer, device)
+            
             load_time = time.time() - start_time
             memory_usage = self._get_memory_usage() - start_memory
             
@@ -213,11 +349,39 @@ class AIServiceFactory:
         except Exception as e:
             raise ModelLoadingError(f"Failed to load NLLB model {config.model_name}: {str(e)}")
     
+    def _compile_nllb_model(self, model: Any, tokenizer: Any, device: str) -> None:
+        """
+        Compile the NLLB forward pass with torch.compile and warm it up.
+        
+        The forward is replaced in place so generate() picks it up, and a short
+        dummy generation triggers compilation now rather than on the first job.
+        Failures leave the model running eagerly.
+        """
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            logger().warning("torch.compile is not available; NLLB model left uncompiled")
+            return
+        
+        start_time = time.time()
+        eager_forward = model.forward
+        try:
+            model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+            inputs = tokenizer("Hello world", return_tensors="pt").to(device)
+            with torch.inference_mode():
+                model.generate(**inputs, max_new_tokens=4)
+            logger().info(f"NLLB model compiled in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            model.forward = eager_forward
+            logger().warning(f"Could not compile NLLB model, running eagerly: {e}")
+    
     def _load_mms_model_info(self, config: ModelConfig) -> CachedModel:
         """Cache MMS model information (models loaded on-demand per language)."""
         logger().info(f"Preparing MMS TTS model cache for device: {config.device}")
         start_time = time.time()
         
+        from app.services.tts.text_to_speech_mms import TextToSpeechMMS
+        
         # MMS models are loaded on-demand per language, so we just cache the configuration
         model_info = {
             "device": config.device,
@@ -249,14 +413,55 @@ class AIServiceFactory:
         Raises:
             ModelLoadingError: If model loading fails
         """
-        cache_key = self._get_cache_key(config)
+        cache_key = config.cache_key or self._get_cache_key(config)
         
         # Return cached model if available
-        if self._cache_enabled and cache_key in self._model_cache:
-            logger().debug(f"Using cached model: {cache_key}")
-            return self._model_cache[cache_key]
+        cached_model = self._get_cached_model(cache_key)
+        if cached_model is not None:
+            return cached_model
         
-        # Load model based on type
+        if not self._cache_enabled:
+            return self._load_uncached_model(config)
+        
+        with self._load_locks_guard:
+            load_lock = self._load_locks.setdefault(cache_key, threading.Lock())
+        
+        with load_lock:
+            # Another job may have loaded it while we waited for the lock
+            cached_model = self._get_cached_model(cache_key)
+            if cached_model is not None:
+                return cached_model
+            
+            cached_model = self._load_uncached_model(config)
+            
+            # Cache the loaded model, evicting the least recently used ones
+            # when the cache is at its MODEL_CACHE_MAX_MODELS limit
+            with self._cache_lock:
+                if self._max_cached_models > 0:
+                    self._evict_lru(self._max_cached_models - 1)
+                self._model_cache[cache_key] = cached_model
+            logger().debug(f"Model cached with key: {format_cache_key(cache_key)}")
+        
+        return cached_model
+    
+    def _get_cached_model(self, cache_key: CacheKey) -> Optional[CachedModel]:
+        """Return the cached model for cache_key, marking it as recently used."""
+        if not self._cache_enabled:
+            return None
+        
+        now = time.monotonic()
+        with self._cache_lock:
+            cached_model = self._model_cache.get(cache_key)
+            if cached_model is not None:
+                cached_model.last_used = now
+                self._model_cache.move_to_end(cache_key)
+        
+        if cached_model is not None and logger().isEnabledFor(logging.DEBUG):
+            logger().debug(f"Using cached model: {format_cache_key(cache_key)}")
+        return cached_model
+    
+    def _load_uncached_model(self, config: ModelConfig) -> CachedModel:
+        """Load a model without consulting or updating the cache."""
         if config.model_type == ModelType.STT_WHISPER:
             cached_model = self._load_whisper_model(config)
         elif config.model_type == ModelType.STT_WHISPER_TRANSFORMERS:
@@ -268,11 +473,7 @@ class AIServiceFactory:
         else:
             raise ModelLoadingError(f"Unsupported model type: {config.model_type}")
         
-        # Cache the loaded model
-        if self._cache_enabled:
-            self._model_cache[cache_key] = cached_model
-            logger().debug(f"Model cached with key: {cache_key}")
-        
+        cached_model.last_used = time.monotonic()
         return cached_model
     
     def get_stt_service(self, stt_type: str, model_name: str) -> Any:
@@ -293,19 +494,11 @@ class AIServiceFactory:
             actual_stt_type = stt_type
         
         if actual_stt_type == "faster-whisper":
-            # Create model configuration
-            config = ModelConfig(
-                model_type=ModelType.STT_WHISPER,
-                model_name=model_name,
-                device=self._device,
-                cache_key="",
-                cpu_threads=self._cpu_threads,
-                vad=self._vad
-            )
-            config.cache_key = self._get_cache_key(config)
+            from app.services.stt.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
             
+            # Create model configuration
             # Load/get cached model
-            cached_model = self.load_model(config)
+            cached_model = self.load_model(self._model_config(ModelType.STT_WHISPER, model_name))
             
             # Create service with cached model
             service = SpeechToTextFasterWhisper(
@@ -319,18 +512,10 @@ class AIServiceFactory:
             return service
             
         elif actual_stt_type == "transformers":
-            # Create model configuration for transformers
-            config = ModelConfig(
-                model_type=ModelType.STT_WHISPER_TRANSFORMERS,
-                model_name=model_name,
-                device=self._device,
-                cache_key="",
-                cpu_threads=self._cpu_threads
-            )
-            config.cache_key = self._get_cache_key(config)
+            from app.services.stt.speech_to_text_whisper_transformers import SpeechToTextWhisperTransformers
             
             # Load/get cached model info
-            cached_model = self.load_model(config)
+            cached_model = self.load_model(self._model_config(ModelType.STT_WHISPER_TRANSFORMERS, model_name))
             
             # Create service (transformers handles its own model loading)
             service = SpeechToTextWhisperTransformers(
@@ -356,29 +541,75 @@ class AIServiceFactory:
             Configured Translation service instance
         """
         if translator_type == "nllb":
-            # Create model configuration
-            config = ModelConfig(
-                model_type=ModelType.TRANSLATION_NLLB,
-                model_name=model_name,
-                device=self._device,
-                cache_key=""
-            )
-            config.cache_key = self._get_cache_key(config)
+            from app.services.translation.translation_nllb import TranslationNLLB
             
             # Load/get cached model
-            cached_model = self.load_model(config)
+            cached_model = self.load_model(self._model_config(ModelType.TRANSLATION_NLLB, model_name))
             
             # Create service with cached model
-            service = TranslationNLLB(self._device)
-            service.model_name = f"facebook/{model_name}"
-            service.tokenizer = cached_model.tokenizer
-            service._cached_model = cached_model.model
-            
-            return service
+            return TranslationNLLB.from_cached(
+                self._device, cached_model.model, cached_model.tokenizer, model_name
+            )
         
         else:
             raise ValueError(f"Unsupported translation type: {translator_type}")
     
+    def get_mms_vits(self, language: str) -> Tuple[Any, Any]:
+        """
+        Get the MMS VITS model and tokenizer for a language, loading on a miss.
+        
+        At most MMS_MAX_CACHED_LANGS languages stay loaded; the least recently
+        used one is dropped to keep memory bounded.
+        
+        Args:
+            language: ISO 639-3 language code
+            
+        Returns:
+            (model, tokenizer) tuple
+        """
+        entry = self._get_cached_mms(language)
+        if entry is not None:
+            return entry
+        
+        with self._load_locks_guard:
+            load_lock = self._mms_load_locks.setdefault(language, threading.Lock())
+        
+        with load_lock:
+            # Another job may have loaded it while we waited for the lock
+            entry = self._get_cached_mms(language)
+            if entry is not None:
+                return entry
+            
+            from transformers import AutoTokenizer, VitsModel
+            
+            model_name = f"facebook/mms-tts-{language}"
+            logger().info(f"Loading MMS TTS model: {model_name} on {self._device}")
+            model = self._from_pretrained(VitsModel, model_name).to(self._device)
+            model.eval()
+            model.requires_grad_(False)
+            entry = (model, self._from_pretrained(AutoTokenizer, model_name))
+            
+            evicted = 0
+            with self._cache_lock:
+                self._mms_models[language] = entry
+                while self._mms_max > 0 and len(self._mms_models) > self._mms_max:
+                    evicted_language, _ = self._mms_models.popitem(last=False)
+                    logger().info(f"Evicted MMS TTS model: {evicted_language}")
+                    evicted += 1
+        
+        if evicted:
+            self._empty_cuda_cache()
+        
+        return entry
+    
+    def _get_cached_mms(self, language: str) -> Optional[Tuple[Any, Any]]:
+        """Return the cached MMS model and tokenizer for language, marking them as recently used."""
+        with self._cache_lock:
+            entry = self._mms_models.get(language)
+            if entry is not None:
+                self._mms_models.move_to_end(language)
+        return entry
+    
     def get_tts_service(self, tts_type: str) -> Any:
         """
         Get a Text-to-Speech service with cached model info.
@@ -390,20 +621,13 @@ class AIServiceFactory:
             Configured TTS service instance
         """
         if tts_type == "mms":
-            # Create model configuration for MMS
-            config = ModelConfig(
-                model_type=ModelType.TTS_MMS,
-                model_name="mms",
-                device=self._device,
-                cache_key=""
-            )
-            config.cache_key = self._get_cache_key(config)
+            from app.services.tts.text_to_speech_mms import TextToSpeechMMS
             
             # Load/get cached model info
-            cached_model = self.load_model(config)
+            cached_model = self.load_model(self._model_config(ModelType.TTS_MMS, "mms"))
             
             # Create service
-            service = TextToSpeechMMS(self._device)
+            service = TextToSpeechMMS(self._device, model_loader=self.get_mms_vits)
             service._cached_model_info = cached_model.model
             
             return service
@@ -431,44 +655,103 @@ class AIServiceFactory:
         
         # Default models to preload
         default_models = [
-            # STT models
-            ModelConfig(
-                model_type=ModelType.STT_WHISPER,
-                model_name=default_stt_model,
-                device=self._device,
-                cache_key="",
-                cpu_threads=self._cpu_threads,
-                vad=self._vad
-            ),
-            # Translation models
-            ModelConfig(
-                model_type=ModelType.TRANSLATION_NLLB,
-                model_name=default_translation_model,
-                device=self._device,
-                cache_key=""
-            ),
-            # TTS model info
-            ModelConfig(
-                model_type=ModelType.TTS_MMS,
-                model_name="mms",
-                device=self._device,
-                cache_key=""
-            )
+            self._model_config(ModelType.STT_WHISPER, default_stt_model),
+            self._model_config(ModelType.TRANSLATION_NLLB, default_translation_model),
+            self._model_config(ModelType.TTS_MMS, "mms")
         ]
         
-        # Load each model
-        loaded_count = 0
-        for config in default_models:
-            try:
-                config.cache_key = self._get_cache_key(config)
-                self.load_model(config)
-                loaded_count += 1
-            except Exception as e:
-                logger().error(f"Failed to preload model {config.model_name}: {str(e)}")
+        loaded_count = self._load_models_concurrently(default_models)
+        
+        if self._preload_share_memory:
+            self._share_cached_model_memory()
+        
+        if self._device == "cuda":
+            self._warm_cuda_allocator()
         
         total_time = time.time() - start_time
         logger().info(f"Model preloading completed: {loaded_count}/{len(default_models)} models loaded in {total_time:.2f}s")
     
+    def preload_default_models_async(self) -> threading.Thread:
+        """
+        Run preload_default_models() in a background daemon thread.
+        
+        The server can start accepting requests right away; health_check()
+        reports "warming" until preloading finishes. Jobs that need a model
+        still being preloaded wait on its load lock rather than loading it again.
+        
+        Returns:
+            The started preload thread
+        """
+        self._preload_done.clear()
+        
+        def run():
+            try:
+                self.preload_default_models()
+            except Exception as e:
+                logger().warning(f"Model preloading failed (will load on-demand): {e}")
+            finally:
+                self._preload_done.set()
+        
+        thread = threading.Thread(target=run, name="model-preload", daemon=True)
+        thread.start()
+        return thread
+    
+    def _warm_cuda_allocator(self):
+        """
+        Bound this process's GPU memory and pre-grow PyTorch's caching allocator.
+        
+        A large block is allocated and released once, so its segment stays in
+        the allocator pool and the first jobs don't stall growing it.
+        """
+        import torch
+        
+        if not torch.cuda.is_available():
+            return
+        
+        memory_fraction = get_env_var("CUDA_MEM_FRACTION", 0.9, float)
+        warmup_mb = get_env_var("CUDA_WARMUP_MB", 2048, int)
+        
+        if 0 < memory_fraction <= 1:
+            torch.cuda.set_per_process_memory_fraction(memory_fraction)
+        
+        if warmup_mb > 0:
+            try:
+                warmup = torch.empty(warmup_mb * 1024 ** 2 // 2, dtype=torch.float16, device="cuda")
+                del warmup
+                torch.cuda.synchronize()
+                logger().info(f"Reserved {warmup_mb}MB in the CUDA caching allocator")
+            except RuntimeError as e:
+                logger().warning(f"Could not warm up CUDA caching allocator: {e}")
+    
+    def _share_cached_model_memory(self):
+        """
+        Move the weights of cached CPU PyTorch models into shared memory.
+        
+        This only pays off when worker processes are forked after the models
+        were preloaded, e.g. a pre-fork server preloading in its master
+        (gunicorn --preload). Workers that preload in their own lifespan share
+        nothing and just copy every weight into /dev/shm.
+        """
+        import torch
+        
+        with self._cache_lock:
+            cached_items = list(self._model_cache.items())
+        
+        for cache_key, cached_model in cached_items:
+            model = cached_model.model
+            if not isinstance(model, torch.nn.Module):
+                continue  # e.g. CTranslate2 Whisper models or MMS config
+            
+            try:
+                if next(model.parameters()).device.type != "cpu":
+                    continue
+                model.share_memory()
+                logger().info(f"Moved weights of {format_cache_key(cache_key)} to shared memory")
+            except StopIteration:
+                continue
+            except Exception as e:
+                logger().warning(f"Could not share memory for {format_cache_key(cache_key)}: {e}")
+    
     def get_model_status(self) -> Dict[str, Any]:
         """
         Get status information about cached models.
@@ -476,15 +759,15 @@ class AIServiceFactory:
         Returns:
             Dictionary containing model cache statistics and health information
         """
-        total_memory = sum(
-            model.memory_usage_mb or 0 
-            for model in self._model_cache.values()
-        )
+        with self._cache_lock:
+            cached_models = list(self._model_cache.items())
         
+        total_memory = 0
         models_info = []
-        for cache_key, cached_model in self._model_cache.items():
+        for cache_key, cached_model in cached_models:
+            total_memory += cached_model.memory_usage_mb or 0
             models_info.append({
-                "cache_key": cache_key,
+                "cache_key": format_cache_key(cache_key),
                 "model_type": cached_model.config.model_type.value if cached_model.config else "unknown",
                 "model_name": cached_model.config.model_name if cached_model.config else "unknown",
                 "device": cached_model.config.device if cached_model.config else "unknown",
@@ -493,28 +776,139 @@ class AIServiceFactory:
             })
         
         return {
-            "cache_enabled": self._cache_enabled,
-            "preload_enabled": self._preload_models,
-            "total_cached_models": len(self._model_cache),
+            **self._static_status,
+            "total_cached_models": len(models_info),
             "total_memory_mb": total_memory,
-            "device": self._device,
-            "cpu_threads": self._cpu_threads,
             "models": models_info
         }
     
-    def clear_cache(self):
-        """Clear all cached models to free memory."""
+    def clear_cache(self) -> int:
+        """Clear all cached models to free memory. Returns the number removed."""
         logger().info("Clearing model cache...")
         
-        # Clear PyTorch cache if using CUDA
-        if self._device == "cuda" and torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        if self._cuda_snapshot_path:
+            self._dump_cuda_memory_snapshot()
         
         # Clear model cache
-        cleared_count = len(self._model_cache)
-        self._model_cache.clear()
+        with self._cache_lock:
+            cleared_count = len(self._model_cache)
+            self._model_cache.clear()
+            self._mms_models.clear()
+        
+        # Clear PyTorch cache if using CUDA
+        self._empty_cuda_cache()
         
         logger().info(f"Model cache cleared: {cleared_count} models removed")
+        return cleared_count
+    
+    def _dump_cuda_memory_snapshot(self):
+        """Write a CUDA allocator snapshot to CUDA_MEMORY_SNAPSHOT for fragmentation analysis."""
+        if self._device != "cuda":
+            return
+        import torch
+        if not torch.cuda.is_available():
+            return
+        try:
+            torch.cuda.memory._dump_snapshot(self._cuda_snapshot_path)
+            logger().info(f"CUDA memory snapshot written to {self._cuda_snapshot_path}")
+        except Exception as e:
+            logger().warning(f"Could not write CUDA memory snapshot: {e}")
+    
+    def _empty_cuda_cache(self):
+        """Return cached, unused GPU memory to the driver when running on CUDA."""
+        if self._device != "cuda":
+            return
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    
+    def _evict_lru(self, keep: int):
+        """Evict least recently used models until at most `keep` remain. Call with _cache_lock held."""
+        evicted = 0
+        while len(self._model_cache) > keep:
+            cache_key, _ = self._model_cache.popitem(last=False)
+            logger().info(f"Evicted least recently used model: {format_cache_key(cache_key)}")
+            evicted += 1
+        
+        if evicted:
+            self._empty_cuda_cache()
+    
+    def preload_models(self, models: List[Tuple[str, str]]) -> int:
+        """
+        Load the given (model_type, model_name) pairs into the cache.
+        
+        Args:
+            models: Pairs such as ("stt_whisper", "tiny") or
+                ("translation_nllb", "nllb-200-distilled-600M")
+                
+        Returns:
+            Number of models loaded (or already cached)
+            
+        Raises:
+            ValueError: If a model type is not recognised
+        """
+        # Same configs as the get_*_service methods, so preloaded entries
+        # share their cache keys
+        configs = [self._model_config(ModelType(model_type), model_name) for model_type, model_name in models]
+        return self._load_models_concurrently(configs)
+    
+    def _load_models_concurrently(self, configs: List[ModelConfig]) -> int:
+        """
+        Load several models in parallel threads. Returns the number loaded.
+        
+        Loading is dominated by downloads, deserialization and device
+        transfers that release the GIL, so overlapping them brings the total
+        close to the slowest single model rather than the sum of all of them.
+        """
+        if not configs:
+            return 0
+        
+        # Initialize CUDA once here so loader threads don't race to create it
+        if self._device == "cuda":
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.init()
+        
+        loaded_count = 0
+        max_workers = min(len(configs), MAX_PRELOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model-preload") as executor:
+            futures = {executor.submit(self.load_model, config): config for config in configs}
+            for future in as_completed(futures):
+                config = futures[future]
+                try:
+                    future.result()
+                    loaded_count += 1
+                except Exception as e:
+                    logger().error(f"Failed to preload model {config.model_name}: {str(e)}")
+        
+        return loaded_count
+    
+    def evict_idle_models(self, min_idle_seconds: float) -> int:
+        """
+        Evict cached models that have not been used for at least min_idle_seconds.
+        
+        Recently used models stay resident, so bursty traffic does not pay the
+        full reload cost that clear_cache() would cause.
+        
+        Returns:
+            Number of models evicted
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            idle_keys = [
+                cache_key
+                for cache_key, cached_model in self._model_cache.items()
+                if now - cached_model.last_used >= min_idle_seconds
+            ]
+            
+            for cache_key in idle_keys:
+                del self._model_cache[cache_key]
+        
+        if idle_keys:
+            self._empty_cuda_cache()
+            logger().info(f"Evicted {len(idle_keys)} models idle for at least {min_idle_seconds:.0f}s")
+        
+        return len(idle_keys)
     
     def health_check(self) -> Dict[str, Any]:
         """
@@ -524,6 +918,8 @@ class AIServiceFactory:
             Dictionary containing health status and diagnostic information
         """
         try:
+            import torch
+            
             # Check basic functionality
             status = {
                 "status": "healthy",
@@ -534,6 +930,10 @@ class AIServiceFactory:
                 "torch_cuda_available": torch.cuda.is_available() if hasattr(torch.cuda, 'is_available') else False
             }
             
+            if not self._preload_done.is_set():
+                status["status"] = "warming"
+                status["warning"] = "Models are still being preloaded"
+            
             # Check CUDA availability if device is set to cuda
             if self._device == "cuda":
                 if torch.cuda.is_available():
@@ -554,12 +954,7 @@ class AIServiceFactory:
             }
 
 
-# Global factory instance
-_ai_factory = None
-
+@lru_cache(maxsize=1)
 def get_ai_factory() -> AIServiceFactory:
-    """Get the global AI Service Factory instance."""
-    global _ai_factory
-    if _ai_factory is None:
-        _ai_factory = AIServiceFactory()
-    return _ai_factory
\ No newline at end of file
+    """Get the global AI Service Factory instance (created on first call)."""
+    return AIServiceFactory()
\ No newline at end of file
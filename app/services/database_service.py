@@ -3,18 +3,41 @@ Database service for job persistence using SQLite in-memory database.
 Provides async CRUD operations for job management.
 """
 
-import json
+import time
+import uuid
+import asyncio
 import sqlite3
 import aiosqlite
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import orjson
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timezone
 import logging
 from contextlib import asynccontextmanager
 
-from app.models.job_models import Job, JobCreate, JobUpdate, JobMetadata
+from app.models.job_models import Job, JobCreate, JobUpdate, JobMetadata, JobStatus
 
 logger = logging.getLogger(__name__)
 
+# Job statuses after which a job no longer changes
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Maximum age of the grouped status-count snapshot reused by count_jobs()
+STATUS_COUNTS_MAX_AGE_SECONDS = 1.0
+
+# Window functions (COUNT(*) OVER ()) are available from SQLite 3.25
+_SQLITE_HAS_WINDOW_FUNCTIONS = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+# UPDATE ... RETURNING is available from SQLite 3.35
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Job summary columns returned by list_jobs_with_total(as_dict=True).
+# Timestamps are stored as ISO strings, so rows serialize to JSON as-is.
+_JOB_SUMMARY_COLUMNS = (
+    "id AS job_id, status, original_filename, source_language, target_language, "
+    "input_file_size AS file_size, created_at, updated_at, completed_at, "
+    "processing_time_seconds, error_message"
+)
+
 
 class DatabaseService:
     """
@@ -27,14 +50,34 @@ class DatabaseService:
     def __init__(self, database_url: str = ":memory:"):
         self.database_url = database_url
         self._db = None
+        # Separate read-only connection for status/list endpoints, so polling
+        # bursts do not queue behind writes on the read-write connection
+        self._ro_db = None
+        # (monotonic timestamp, {status: count}) from the last grouped count
+        self._status_counts_snapshot: Optional[tuple] = None
+        
+    def _connection_uris(self) -> Tuple[str, str]:
+        """Return (read-write URI, read-only URI) for the configured database."""
+        if self.database_url == ":memory:":
+            # A named shared-cache memory database is visible to both connections
+            uri = f"file:jobs_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            return uri, uri
+        return f"file:{self.database_url}", f"file:{self.database_url}?mode=ro"
         
     async def initialize(self):
-        """Initialize the database connection and create tables."""
+        """Initialize the database connections and create tables."""
         try:
-            self._db = await aiosqlite.connect(self.database_url)
+            rw_uri, ro_uri = self._connection_uris()
+            self._db = await aiosqlite.connect(rw_uri, uri=True)
             # Enable foreign key constraints
             await self._db.execute("PRAGMA foreign_keys = ON")
             await self.create_tables()
+            
+            self._ro_db = await aiosqlite.connect(ro_uri, uri=True)
+            await self._ro_db.execute("PRAGMA query_only = ON")
+            # Shared-cache readers would otherwise fail with "table is locked"
+            # while the writer holds an open transaction
+            await self._ro_db.execute("PRAGMA read_uncommitted = ON")
             logger.info(f"Database initialized successfully: {self.database_url}")
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
@@ -71,6 +114,9 @@ class DatabaseService:
             updated_at TEXT NOT NULL,
             completed_at TEXT,
             
+            -- Serialized job details, cached once the job reaches a terminal state
+            details_json TEXT,
+            
             -- Status constraint
             CHECK (status IN ('uploaded', 'processing', 'completed', 'failed', 'cancelled'))
         );
@@ -111,7 +157,7 @@ class DatabaseService:
             translation_engine=job_create.translation_engine,
             translation_model=job_create.translation_model,
             tts_engine=job_create.tts_engine,
-            job_metadata=job_create.job_metadata.dict() if job_create.job_metadata else None
+            job_metadata=job_create.job_metadata
         )
         
         insert_sql = """
@@ -124,7 +170,7 @@ class DatabaseService:
         """
         
         try:
-            job_metadata_json = json.dumps(job.job_metadata) if job.job_metadata else None
+            job_metadata_json = job.job_metadata.model_dump_json() if job.job_metadata else None
             
             await self._db.execute(insert_sql, (
                 job.id, job.original_filename, job.source_language, job.target_language,
@@ -135,6 +181,7 @@ class DatabaseService:
             ))
             
             await self._db.commit()
+            self._status_counts_snapshot = None
             logger.info(f"Created job: {job.id}")
             return job
             
@@ -144,11 +191,19 @@ class DatabaseService:
 
     async def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID."""
+        return await self._get_job(self._db, job_id)
+
+    async def get_job_ro(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID using the read-only connection."""
+        return await self._get_job(self._ro_db, job_id)
+
+    async def _get_job(self, db: aiosqlite.Connection, job_id: str) -> Optional[Job]:
+        """Get a job by ID using the given connection."""
         
         select_sql = "SELECT * FROM jobs WHERE id = ?"
         
         try:
-            async with self._db.execute(select_sql, (job_id,)) as cursor:
+            async with db.execute(select_sql, (job_id,)) as cursor:
                 row = await cursor.fetchone()
                 
             if row is None:
@@ -160,6 +215,35 @@ class DatabaseService:
             logger.error(f"Failed to get job {job_id}: {e}")
             raise
 
+    async def get_job_status_lite(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get only the fields needed for progress polling, without building a Job."""
+
+        select_sql = """
+        SELECT status,
+               json_extract(job_metadata, '$.progress_stage'),
+               json_extract(job_metadata, '$.progress_percentage'),
+               updated_at
+        FROM jobs WHERE id = ?
+        """
+
+        try:
+            async with self._ro_db.execute(select_sql, (job_id,)) as cursor:
+                row = await cursor.fetchone()
+
+            if row is None:
+                return None
+
+            return {
+                "status": row[0],
+                "progress_stage": row[1],
+                "progress_percentage": row[2],
+                "updated_at": row[3],
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get status for job {job_id}: {e}")
+            raise
+
     async def update_job(self, job_id: str, job_update: JobUpdate) -> Optional[Job]:
         """Update a job with new data."""
         
@@ -193,7 +277,7 @@ class DatabaseService:
             
         if job_update.job_metadata is not None:
             update_fields.append("job_metadata = ?")
-            values.append(json.dumps(job_update.job_metadata.dict()))
+            values.append(job_update.job_metadata.model_dump_json())
             
         if job_update.completed_at is not None:
             update_fields.append("completed_at = ?")
@@ -201,7 +285,7 @@ class DatabaseService:
         
         # Always update the updated_at timestamp
         update_fields.append("updated_at = ?")
-        values.append(datetime.utcnow().isoformat())
+        values.append(datetime.now(timezone.utc).isoformat())
         
         if not update_fields:
             # No fields to update
@@ -213,14 +297,69 @@ class DatabaseService:
         try:
             await self._db.execute(update_sql, values)
             await self._db.commit()
+            self._status_counts_snapshot = None
             
             logger.info(f"Updated job: {job_id}")
-            return await self.get_job(job_id)
+            job = await self.get_job(job_id)
+            
+            if job and job.status in TERMINAL_STATUSES:
+                await self._cache_job_details(job)
+            
+            return job
             
         except Exception as e:
             logger.error(f"Failed to update job {job_id}: {e}")
             raise
 
+    async def cancel_job_if_active(self, job_id: str) -> Optional[Job]:
+        """
+        Mark a job as cancelled unless it has already finished.
+        
+        The status check and the update happen in a single conditional UPDATE,
+        so there is no race between reading the status and writing it.
+        Returns the cancelled job, or None if no unfinished job with that ID exists.
+        """
+        
+        now = datetime.now(timezone.utc).isoformat()
+        update_sql = (
+            "UPDATE jobs SET status = 'cancelled', completed_at = ?, updated_at = ?"
+            " WHERE id = ? AND status NOT IN (?, ?, ?)"
+        )
+        values = (now, now, job_id, *TERMINAL_STATUSES)
+        
+        try:
+            if _SQLITE_HAS_RETURNING:
+                async with self._db.execute(update_sql + " RETURNING *", values) as cursor:
+                    row = await cursor.fetchone()
+                await self._db.commit()
+                job = self._row_to_job(row) if row else None
+            else:
+                cursor = await self._db.execute(update_sql, values)
+                await self._db.commit()
+                job = await self.get_job(job_id) if cursor.rowcount > 0 else None
+            
+            if job is None:
+                return None
+            
+            self._status_counts_snapshot = None
+            await self._cache_job_details(job)
+            logger.info(f"Cancelled job: {job_id}")
+            return job
+            
+        except Exception as e:
+            logger.error(f"Failed to cancel job {job_id}: {e}")
+            raise
+
+    async def _cache_job_details(self, job: Job):
+        """Store the serialized details payload of a job that reached a terminal state."""
+        # Terminal jobs no longer change, so their details only need serializing once
+        job.details_json = orjson.dumps(job.details_dict()).decode()
+        await self._db.execute(
+            "UPDATE jobs SET details_json = ? WHERE id = ?",
+            (job.details_json, job.id)
+        )
+        await self._db.commit()
+
     async def list_jobs(
         self, 
         status: Optional[str] = None,
@@ -255,9 +394,79 @@ class DatabaseService:
             logger.error(f"Failed to list jobs: {e}")
             raise
 
+    async def list_jobs_with_total(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        as_dict: bool = False
+    ) -> Tuple[List[Any], int]:
+        """
+        List a page of jobs together with the total matching count in one query.
+        
+        With as_dict=True, rows are returned as plain job-summary dicts (as used by
+        the /jobs endpoint) built straight from the cursor, skipping Job construction;
+        columns that are NULL are omitted from the dicts.
+        """
+        
+        where_sql = ""
+        values = []
+        
+        if status:
+            where_sql = " WHERE status = ?"
+            values.append(status)
+        
+        if _SQLITE_HAS_WINDOW_FUNCTIONS:
+            total_sql = "COUNT(*) OVER ()"
+        else:
+            # Older SQLite: fold the count into the same statement as a scalar subquery
+            total_sql = f"(SELECT COUNT(*) FROM jobs{where_sql})"
+            values = values * 2
+        
+        columns_sql = _JOB_SUMMARY_COLUMNS if as_dict else "*"
+        select_sql = (
+            f"SELECT {columns_sql}, {total_sql} AS total_count FROM jobs{where_sql}"
+            " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        )
+        values.extend([limit, offset])
+        
+        try:
+            async with self._ro_db.execute(select_sql, values) as cursor:
+                rows = await cursor.fetchall()
+            
+            if rows:
+                total_count = rows[0][-1]
+            elif offset:
+                # Page is past the end, so there is no row to carry the total
+                total_count = await self.count_jobs(status)
+            else:
+                total_count = 0
+            
+            if as_dict:
+                # Unset optional fields are left out rather than sent as null
+                keys = [column[0] for column in cursor.description][:-1]
+                jobs = [
+                    {key: value for key, value in zip(keys, row) if value is not None}
+                    for row in rows
+                ]
+            else:
+                jobs = [self._row_to_job(row) for row in rows]
+            logger.info(f"Listed {len(jobs)} of {total_count} jobs")
+            return jobs, total_count
+            
+        except Exception as e:
+            logger.error(f"Failed to list jobs: {e}")
+            raise
+
     async def count_jobs(self, status: Optional[str] = None) -> int:
         """Count total jobs with optional status filter."""
         
+        # Reuse a recent grouped count if one is available
+        snapshot = self._status_counts_snapshot
+        if snapshot and time.monotonic() - snapshot[0] < STATUS_COUNTS_MAX_AGE_SECONDS:
+            counts = snapshot[1]
+            return counts.get(status, 0) if status else sum(counts.values())
+        
         base_sql = "SELECT COUNT(*) FROM jobs"
         values = []
         
@@ -275,6 +484,23 @@ class DatabaseService:
             logger.error(f"Failed to count jobs: {e}")
             raise
 
+    async def count_jobs_by_status(self) -> Dict[str, int]:
+        """Count jobs per status in a single query."""
+        
+        select_sql = "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        
+        try:
+            async with self._ro_db.execute(select_sql) as cursor:
+                rows = await cursor.fetchall()
+            
+            counts = {status: count for status, count in rows}
+            self._status_counts_snapshot = (time.monotonic(), counts)
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Failed to count jobs by status: {e}")
+            raise
+
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job by ID."""
         
@@ -283,6 +509,7 @@ class DatabaseService:
         try:
             cursor = await self._db.execute(delete_sql, (job_id,))
             await self._db.commit()
+            self._status_counts_snapshot = None
             
             deleted = cursor.rowcount > 0
             if deleted:
@@ -305,7 +532,7 @@ class DatabaseService:
             'original_filename': row[1],
             'source_language': row[2],
             'target_language': row[3],
-            'status': row[4],
+            'status': JobStatus(row[4]),
             'input_file_path': row[5],
             'output_file_path': row[6],
             'input_file_size': row[7],
@@ -317,13 +544,14 @@ class DatabaseService:
             'translation_engine': row[13],
             'translation_model': row[14],
             'tts_engine': row[15],
-            'job_metadata': json.loads(row[16]) if row[16] else None,
+            'job_metadata': JobMetadata.model_construct(**orjson.loads(row[16])) if row[16] else None,
             'created_at': datetime.fromisoformat(row[17]),
             'updated_at': datetime.fromisoformat(row[18]),
-            'completed_at': datetime.fromisoformat(row[19]) if row[19] else None
+            'completed_at': datetime.fromisoformat(row[19]) if row[19] else None,
+            'details_json': row[20]
         }
         
-        return Job(**job_data)
+        return Job.from_row(job_data)
 
     async def health_check(self) -> Dict[str, Any]:
         """Check database health and return status information."""
@@ -333,20 +561,17 @@ class DatabaseService:
             await self._db.execute("SELECT 1")
             
             # Get job statistics
-            total_jobs = await self.count_jobs()
-            processing_jobs = await self.count_jobs("processing")
-            completed_jobs = await self.count_jobs("completed")
-            failed_jobs = await self.count_jobs("failed")
+            counts = await self.count_jobs_by_status()
             
             return {
                 "status": "healthy",
                 "database_type": "sqlite_memory",
                 "connection": "active",
                 "statistics": {
-                    "total_jobs": total_jobs,
-                    "processing_jobs": processing_jobs,
-                    "completed_jobs": completed_jobs,
-                    "failed_jobs": failed_jobs
+                    "total_jobs": sum(counts.values()),
+                    "processing_jobs": counts.get("processing", 0),
+                    "completed_jobs": counts.get("completed", 0),
+                    "failed_jobs": counts.get("failed", 0)
                 }
             }
             
@@ -357,8 +582,18 @@ class DatabaseService:
                 "error": str(e)
             }
 
+    def connection_stats(self) -> Dict[str, Any]:
+        """Return information about the database connection."""
+        return {
+            "database_type": "sqlite_memory",
+            "database_url": self.database_url,
+            "open_connections": sum(1 for db in (self._db, self._ro_db) if db)
+        }
+
     async def close(self):
-        """Close the database connection."""
+        """Close the database connections."""
+        if self._ro_db:
+            await self._ro_db.close()
         if self._db:
             await self._db.close()
             logger.info("Database connection closed")
@@ -366,15 +601,25 @@ class DatabaseService:
 
 # Global database service instance
 _db_service: Optional[DatabaseService] = None
+_db_service_lock = asyncio.Lock()
 
 
 async def get_database_service() -> DatabaseService:
-    """Get the global database service instance."""
+    """
+    Get the global database service instance.
+    
+    The service holds one process-wide read-write connection plus one read-only
+    connection, both reused by every handler.
+    """
     global _db_service
     
     if _db_service is None:
-        _db_service = DatabaseService()
-        await _db_service.initialize()
+        async with _db_service_lock:
+            # Concurrent first callers must not each open their own database
+            if _db_service is None:
+                db_service = DatabaseService()
+                await db_service.initialize()
+                _db_service = db_service
     
     return _db_service
 
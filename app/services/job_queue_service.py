@@ -7,8 +7,9 @@ import asyncio
 import logging
 import time
 import os
-from typing import Dict, List, Optional, Callable, Any
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Callable, Any, Tuple
+from datetime import datetime, timezone
 
 from app.models.job_models import Job, JobUpdate, ProgressUpdate
 # Import the original TranslationRequest dataclass from translation_service
@@ -18,14 +19,27 @@ from app.services.util import get_env_var
 
 logger = logging.getLogger(__name__)
 
+# Coalescing window and maximum batch size for submit_job_batched()
+SUBMIT_BATCH_WINDOW_MS = get_env_var("SUBMIT_BATCH_WINDOW_MS", 20, int)
+SUBMIT_BATCH_MAX_SIZE = get_env_var("SUBMIT_BATCH_MAX_SIZE", 32, int)
+
+# Where translated videos are written
+OUTPUT_DIRECTORY = get_env_var("OUTPUT_DIRECTORY", "output/")
+
+# Keep uploaded source videos after their job finishes (removed by default)
+KEEP_UPLOADED_FILES = get_env_var("KEEP_UPLOADED_FILES", False, bool)
+
 
 class JobProcessor:
     """
     Handles async processing of individual translation jobs.
     """
     
-    def __init__(self, translation_service: TranslationService):
+    def __init__(self, translation_service: TranslationService, executor: Optional[ThreadPoolExecutor] = None):
         self.translation_service = translation_service
+        # Dedicated pool for the blocking translation pipeline, so long jobs
+        # never occupy the default executor used for file I/O and probes
+        self.executor = executor
     
     async def process_job(
         self, 
@@ -59,7 +73,7 @@ class JobProcessor:
                 )
             
             # Prepare translation request using the original dataclass
-            output_dir = os.environ.get("OUTPUT_DIRECTORY", "output/")
+            output_dir = OUTPUT_DIRECTORY
             output_filename = f"translated_{job.original_filename}"
             output_path = os.path.join(output_dir, output_filename)
             
@@ -92,8 +106,8 @@ class JobProcessor:
             )
             
             # Perform the actual translation
-            result = await asyncio.to_thread(
-                self.translation_service.translate_video, translation_request
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.translation_service.translate_video, translation_request
             )
             
             # Cancel progress simulation
@@ -108,8 +122,11 @@ class JobProcessor:
                 
                 # Get output file size
                 output_file_size = 0
-                if output_file_path and os.path.exists(output_file_path):
-                    output_file_size = os.path.getsize(output_file_path)
+                if output_file_path:
+                    try:
+                        output_file_size = os.stat(output_file_path).st_size
+                    except FileNotFoundError:
+                        pass
                 
                 # Update job as completed
                 job_update = JobUpdate(
@@ -118,7 +135,7 @@ class JobProcessor:
                     output_file_path=output_file_path,
                     output_file_size=output_file_size,
                     processing_time_seconds=processing_time,
-                    completed_at=datetime.utcnow()
+                    completed_at=datetime.now(timezone.utc)
                 )
                 
                 await db_service.update_job(job.id, job_update)
@@ -139,7 +156,7 @@ class JobProcessor:
                     status="failed",
                     error_message=result.error_message,
                     processing_time_seconds=processing_time,
-                    completed_at=datetime.utcnow()
+                    completed_at=datetime.now(timezone.utc)
                 )
                 
                 await db_service.update_job(job.id, job_update)
@@ -148,10 +165,11 @@ class JobProcessor:
                 if progress_callback:
                     await self._send_progress_update(
                         progress_callback, job.id, "failed", "failed", 0.0,
-                        f"Translation failed: {result.error_message}"
+                        f"Translation failed: {result.error_message}",
+                        result.error_code
                     )
                 
-                logger.error(f"Job {job.id} failed: {result.error_message}")
+                logger.error(f"Job {job.id} failed [{result.error_code}]: {result.error_message}")
                 return False
                 
         except Exception as e:
@@ -164,7 +182,7 @@ class JobProcessor:
                     status="failed",
                     error_message=error_message,
                     processing_time_seconds=processing_time,
-                    completed_at=datetime.utcnow()
+                    completed_at=datetime.now(timezone.utc)
                 )
                 
                 db_service = await get_database_service()
@@ -182,6 +200,16 @@ class JobProcessor:
             
             logger.error(f"Job {job.id} failed with exception: {e}")
             return False
+        
+        finally:
+            # The uploaded source video is not needed once the job has finished
+            if not KEEP_UPLOADED_FILES:
+                try:
+                    os.remove(job.input_file_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Failed to remove upload for job {job.id}: {e}")
     
     async def _send_progress_update(
         self, 
@@ -190,16 +218,20 @@ class JobProcessor:
         status: str,
         stage: str,
         percentage: float,
-        message: str
+        message: str,
+        error_details: Optional[str] = None
     ):
         """Send a progress update via callback."""
         try:
-            progress_update = ProgressUpdate(
+            # Values come from the job processor itself, so skip validation;
+            # the update is only ever encoded by ProgressUpdate.message_bytes()
+            progress_update = ProgressUpdate.model_construct(
                 job_id=job_id,
                 status=status,
                 stage=stage,
                 percentage=percentage,
-                message=message
+                message=message,
+                error_details=error_details
             )
             
             if asyncio.iscoroutinefunction(callback):
@@ -249,12 +281,23 @@ class JobQueueService:
         self.active_jobs: Dict[str, asyncio.Task] = {}
         self.progress_callbacks: Dict[str, List[Callable[[ProgressUpdate], None]]] = {}
         self.processor: Optional[JobProcessor] = None
+        self._translate_executor: Optional[ThreadPoolExecutor] = None
         self._queue_task: Optional[asyncio.Task] = None
         self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
         
+        # Coalescing submit path (see submit_job_batched)
+        self._pending_submissions: List[Tuple[Job, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        
     def initialize(self, translation_service: TranslationService):
         """Initialize the job queue service with translation service."""
-        self.processor = JobProcessor(translation_service)
+        # One GPU shared between jobs usually wants TRANSLATE_WORKERS=1
+        translate_workers = get_env_var("TRANSLATE_WORKERS", self.max_concurrent_jobs, int)
+        self._translate_executor = ThreadPoolExecutor(
+            max_workers=translate_workers,
+            thread_name_prefix="translate"
+        )
+        self.processor = JobProcessor(translation_service, self._translate_executor)
         self._queue_task = asyncio.create_task(self._process_queue())
         logger.info(f"Job queue service initialized with max {self.max_concurrent_jobs} concurrent jobs")
     
@@ -264,6 +307,54 @@ class JobQueueService:
         await self.job_queue.put(job)
         return job.id
     
+    def submit_many(self, jobs: List[Job]) -> List[str]:
+        """Submit several jobs for async processing in one call."""
+        for job in jobs:
+            self.job_queue.put_nowait(job)
+        logger.info(f"Submitted {len(jobs)} jobs to queue")
+        return [job.id for job in jobs]
+    
+    async def submit_job_batched(self, job: Job) -> str:
+        """
+        Submit a job through the coalescing path.
+        
+        Submissions arriving within SUBMIT_BATCH_WINDOW_MS of each other (or until
+        SUBMIT_BATCH_MAX_SIZE are pending) are handed to submit_many() together.
+        Each caller still waits for and receives its own job's acknowledgement.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending_submissions.append((job, future))
+        
+        if len(self._pending_submissions) >= SUBMIT_BATCH_MAX_SIZE:
+            self._flush_submissions()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_submissions_after_window())
+        
+        return await future
+    
+    async def _flush_submissions_after_window(self):
+        """Flush pending submissions once the batching window has elapsed."""
+        await asyncio.sleep(SUBMIT_BATCH_WINDOW_MS / 1000)
+        self._flush_submissions()
+    
+    def _flush_submissions(self):
+        """Submit all pending jobs in one batch and acknowledge their callers."""
+        batch, self._pending_submissions = self._pending_submissions, []
+        if not batch:
+            return
+        
+        try:
+            self.submit_many([job for job, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for job, future in batch:
+            if not future.done():
+                future.set_result(job.id)
+    
     def add_progress_callback(self, job_id: str, callback: Callable[[ProgressUpdate], None]):
         """Add a progress callback for a specific job."""
         if job_id not in self.progress_callbacks:
@@ -361,7 +452,7 @@ class JobQueueService:
                 db_service = await get_database_service()
                 await db_service.update_job(
                     job_id, 
-                    JobUpdate(status="cancelled", completed_at=datetime.utcnow())
+                    JobUpdate(status="cancelled", completed_at=datetime.now(timezone.utc))
                 )
             except Exception as e:
                 logger.error(f"Failed to update cancelled job {job_id}: {e}")
@@ -379,6 +470,13 @@ class JobQueueService:
         if self._queue_task:
             self._queue_task.cancel()
         
+        # Stop the batching window; callers still waiting on it are cancelled
+        if self._flush_task:
+            self._flush_task.cancel()
+        for _, future in self._pending_submissions:
+            future.cancel()
+        self._pending_submissions = []
+        
         # Cancel all active jobs
         for job_id, task in self.active_jobs.items():
             task.cancel()
@@ -388,6 +486,10 @@ class JobQueueService:
         if self.active_jobs:
             await asyncio.gather(*self.active_jobs.values(), return_exceptions=True)
         
+        # Running translations cannot be interrupted; don't wait for them
+        if self._translate_executor:
+            self._translate_executor.shutdown(wait=False, cancel_futures=True)
+        
         logger.info("Job queue service shut down")
 
 
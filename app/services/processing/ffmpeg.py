@@ -3,6 +3,7 @@ import shutil
 import subprocess
 import tempfile
 
+from functools import lru_cache
 from typing import List
 
 from app import logger
@@ -75,7 +76,10 @@ class FFmpeg:
             os.remove(tmp_filename)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_ffmpeg_installed():
+        # Probed once per process: /health calls this on every request and
+        # spawning ffprobe each time costs a fork/exec
         cmd = ["ffprobe", "-version"]
         try:
             if (
@@ -40,7 +40,7 @@ class SpeechToTextWhisperTransformers(SpeechToText):
             audio_input, sampling_rate=16000, return_tensors="pt"
         ).input_features
 
-        with torch.no_grad():
+        with torch.inference_mode():
             generated_ids = self._model.generate(
                 input_features, language=source_language_iso_639_1
             )
@@ -60,7 +60,7 @@ class SpeechToTextWhisperTransformers(SpeechToText):
             audio_input, sampling_rate=16000, return_tensors="pt"
         ).input_features
 
-        with torch.no_grad():
+        with torch.inference_mode():
             generated_ids = self._model.generate(input_features)
 
         # Decode the transcription including special tokens to capture the language token
@@ -1,3 +1,6 @@
+import copy
+
+import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
 from app import logger
@@ -8,9 +11,25 @@ class TranslationNLLB(Translation):
 
     def __init__(self, device="cpu"):
         super().__init__(device)
+        self.model = None
         self.translator = None
         self.translator_languages = ""
 
+    @classmethod
+    def from_cached(cls, device, model, tokenizer, model_name):
+        """
+        Create a service around an already loaded model and tokenizer.
+
+        The model is shared, but the tokenizer is copied: the translation
+        pipeline sets its src_lang on every call, and concurrent jobs must
+        not change each other's language.
+        """
+        service = cls(device)
+        service.model_name = f"facebook/{model_name}"
+        service.model = model
+        service.tokenizer = copy.deepcopy(tokenizer)
+        return service
+
     def load_model(self, name="nllb-200-1.3B"):
         self.model_name = f"facebook/{name}"
         self.tokenizer = self._get_tokenizer_nllb()
@@ -20,10 +39,11 @@ class TranslationNLLB(Translation):
     ) -> str:
         languages = f"{source_language}{target_language}"
         if not self.translator or self.translator_languages != languages:
-            model = self._get_model_nllb()
+            if self.model is None:
+                self.model = self._get_model_nllb()
             self.translator = pipeline(
                 "translation",
-                model=model,
+                model=self.model,
                 tokenizer=self.tokenizer,
                 src_lang=self._get_nllb_language(source_language),
                 tgt_lang=self._get_nllb_language(target_language),
@@ -31,7 +51,8 @@ class TranslationNLLB(Translation):
             )
             self.translator_languages = languages
 
-        translated = self.translator(text)
+        with torch.inference_mode():
+            translated = self.translator(text)
         return translated[0]["translation_text"]
 
     def _get_tokenizer_nllb(self):
@@ -52,9 +73,8 @@ class TranslationNLLB(Translation):
                 raise e
 
     def get_language_pairs(self):
-        tokenizer = self._get_tokenizer_nllb()
         # Returns 'cat_Latn'
-        original_list = tokenizer.additional_special_tokens
+        original_list = self.tokenizer.additional_special_tokens
         # Get only the language codes
         supported_languages = [s[:3] for s in original_list]
         pairs = set()
@@ -69,8 +89,7 @@ class TranslationNLLB(Translation):
         return pairs
 
     def _get_nllb_language(self, source_language_iso_639_3: str) -> str:
-        tokenizer = self._get_tokenizer_nllb()
-        nllb_languages = tokenizer.additional_special_tokens
+        nllb_languages = self.tokenizer.additional_special_tokens
         for nllb_language in nllb_languages:
             if nllb_language[:3] == source_language_iso_639_3:
                 return nllb_language
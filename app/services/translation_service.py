@@ -11,10 +11,10 @@ from iso639 import Lang
 from app import logger
 from app.services.processing.dubbing import Dubber
 from app.services.processing.ffmpeg import FFmpeg
-from app.services.util import get_env_var
+from app.services.util import ensure_dir, get_env_var
 from app.services.ai_service_factory import get_ai_factory, ModelLoadingError
 
-@dataclass
+@dataclass(slots=True)
 class TranslationRequest:
     """Request parameters for video translation."""
     input_file: str
@@ -28,13 +28,14 @@ class TranslationRequest:
     output_directory: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationResult:
     """Result of video translation operation."""
     success: bool
     audio_file: Optional[str] = None
     video_file: Optional[str] = None
     error_message: Optional[str] = None
+    error_code: Optional[str] = None
     processing_time_seconds: Optional[float] = None
 
 
@@ -63,6 +64,17 @@ class ConfigurationError(TranslationServiceError):
     pass
 
 
+# TranslationResult.error_code for each known failure, so callers can
+# classify errors without inspecting the message text
+ERROR_CODES = {
+    InvalidLanguageError: "LANGUAGE",
+    InvalidFileFormatError: "FORMAT",
+    MissingDependencyError: "DEPENDENCY",
+    ConfigurationError: "CONFIGURATION",
+    ModelLoadingError: "MODEL_LOAD",
+}
+
+
 class TranslationService:
     """Service for translating videos using AI models with performance optimizations."""
     
@@ -237,8 +249,7 @@ class TranslationService:
             self._check_languages(source_language, request.target_language, tts, translation, stt)
             
             # Create output directory
-            if not os.path.exists(output_directory):
-                os.makedirs(output_directory)
+            ensure_dir(output_directory)
             
             # Initialize dubber and process video
             dubber = Dubber(
@@ -278,6 +289,7 @@ class TranslationService:
             return TranslationResult(
                 success=False,
                 error_message=error_message,
+                error_code=ERROR_CODES[type(e)],
                 processing_time_seconds=processing_time
             )
             
@@ -290,6 +302,7 @@ class TranslationService:
             return TranslationResult(
                 success=False,
                 error_message=error_message,
+                error_code=ERROR_CODES[ModelLoadingError],
                 processing_time_seconds=processing_time
             )
             
@@ -302,6 +315,7 @@ class TranslationService:
             return TranslationResult(
                 success=False,
                 error_message=error_message,
+                error_code="INTERNAL",
                 processing_time_seconds=processing_time
             )
     
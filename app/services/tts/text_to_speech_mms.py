@@ -12,9 +12,11 @@ from app.services.tts.text_to_speech import TextToSpeech, Voice
 
 class TextToSpeechMMS(TextToSpeech):
 
-    def __init__(self, device="cpu"):
+    def __init__(self, device="cpu", model_loader=None):
         super().__init__()
         self.device = device
+        # Optional callable language -> (model, tokenizer), e.g. a shared cache
+        self.model_loader = model_loader
 
     def get_available_voices(self, language_code: str) -> List[Voice]:
         return [Voice(name="voice", gender=self._SSML_MALE)]
@@ -33,12 +35,15 @@ class TextToSpeechMMS(TextToSpeech):
         local_files_only = False
 
         # Load pre-trained model and tokenizer
-        model = VitsModel.from_pretrained(
-            f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
-        ).to(self.device)
-        tokenizer = AutoTokenizer.from_pretrained(
-            f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
-        )
+        if self.model_loader:
+            model, tokenizer = self.model_loader(target_language)
+        else:
+            model = VitsModel.from_pretrained(
+                f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
+            ).to(self.device)
+            tokenizer = AutoTokenizer.from_pretrained(
+                f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
+            )
         inputs = tokenizer(text, return_tensors="pt").to(self.device)
 
         # Model returns for some sequences of tokens no result
@@ -51,7 +56,7 @@ class TextToSpeechMMS(TextToSpeech):
                 f"TextToSpeechMMS._convert_text_to_speech. Model returns input tokens for text '{text}', generating an empty WAV file."
             )
         else:
-            with torch.no_grad():
+            with torch.inference_mode():
                 output = model(**inputs).waveform
 
             # Convert waveform to NumPy array and scale to 16-bit PCM
@@ -59,8 +64,11 @@ class TextToSpeechMMS(TextToSpeech):
             output_np = (
                 output.squeeze().cpu().numpy()
             )  # Remove batch dimension if present
-            output_np = np.clip(output_np, -1, 1)  # Clip values to be between -1 and 1
-            output_np = (output_np * 32767).astype(np.int16)  # Scale to 16-bit PCM
+            # Clip values to be between -1 and 1 and scale to 16-bit PCM, in
+            # place so only the final int16 array is allocated
+            np.clip(output_np, -1, 1, out=output_np)
+            output_np *= 32767
+            output_np = output_np.astype(np.int16)
 
             # Get the sampling rate
             sampling_rate = model.config.sampling_rate
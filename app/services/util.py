@@ -1,5 +1,7 @@
 
 import os
+from datetime import datetime, timezone
+from functools import lru_cache
 
 from app import logger
 
@@ -20,6 +22,12 @@ def get_env_var(var_name: str, default_value, var_type=str, choices=None):
             except ValueError:
                 logger().warning(f"Invalid integer value for {var_name}: {value}. Using default: {default_value}")
                 return default_value
+        elif var_type == float:
+            try:
+                value = float(value)
+            except ValueError:
+                logger().warning(f"Invalid float value for {var_name}: {value}. Using default: {default_value}")
+                return default_value
         elif var_type == str:
             pass  # No conversion needed
         
@@ -29,4 +37,15 @@ def get_env_var(var_name: str, default_value, var_type=str, choices=None):
             return default_value
         
         return value
-    
\ No newline at end of file
+
+
+def utcnow_iso() -> str:
+        """Current UTC time as an ISO 8601 string with a Z suffix."""
+        return datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+@lru_cache(maxsize=8)
+def ensure_dir(path: str) -> str:
+        """Create a directory if needed; repeated calls for the same path are free."""
+        os.makedirs(path, exist_ok=True)
+        return path
@@ -9,6 +9,8 @@ class VideoTranslationApp {
         this.websocket = null;
         this.pollInterval = null;
         this.currentFile = null;
+        this.textDecoder = new TextDecoder();
+        this.textEncoder = new TextEncoder();
         
         this.init();
     }
@@ -335,6 +337,8 @@ class VideoTranslationApp {
 
         try {
             this.websocket = new WebSocket(wsUrl);
+            // Progress updates arrive as binary frames of UTF-8 JSON
+            this.websocket.binaryType = 'arraybuffer';
 
             this.websocket.onopen = () => {
                 console.log('WebSocket connected');
@@ -342,8 +346,10 @@ class VideoTranslationApp {
             };
 
             this.websocket.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-                this.handleProgressUpdate(data);
+                const text = typeof event.data === 'string'
+                    ? event.data
+                    : this.textDecoder.decode(event.data);
+                this.handleProgressUpdate(JSON.parse(text));
             };
 
             this.websocket.onerror = (error) => {
@@ -368,7 +374,10 @@ class VideoTranslationApp {
      * Handle progress updates
      */
     handleProgressUpdate(data) {
-        if (data.type === 'progress_update') {
+        if (data.type === 'progress_batch') {
+            // Several queued messages delivered in one frame, oldest first
+            data.data.forEach((message) => this.handleProgressUpdate(message));
+        } else if (data.type === 'progress_update') {
             const progress = data.data;
             this.updateProgress(progress.percentage, progress.message);
             
@@ -379,7 +388,7 @@ class VideoTranslationApp {
         } else if (data.type === 'ping') {
             // Respond to ping
             if (this.websocket && this.websocket.readyState === WebSocket.OPEN) {
-                this.websocket.send(JSON.stringify({ type: 'pong' }));
+                this.websocket.send(this.textEncoder.encode(JSON.stringify({ type: 'pong' })));
             }
         }
     }
@@ -392,18 +401,21 @@ class VideoTranslationApp {
         
         this.pollInterval = setInterval(async () => {
             try {
-                const response = await fetch(`/api/v1/jobs/${this.currentJobId}/status`);
+                const response = await fetch(`/api/v1/jobs/${this.currentJobId}/status/lite`);
                 const result = await response.json();
-                
+
                 if (response.ok) {
-                    this.updateJobDisplay(result);
-                    
-                    // Stop polling if job is complete
+                    this.updateJobStatus(result.status);
+                    const stage = result.progress_stage || result.status;
+                    this.updateProgress(result.progress_percentage || 0, this.getStatusMessage(result.status, stage));
+
+                    // Stop polling if job is complete and load the full job once
                     if (!this.isJobProcessing(result.status)) {
                         this.stopPolling();
                         if (this.websocket) {
                             this.websocket.close();
                         }
+                        await this.loadJobStatus(this.currentJobId);
                     }
                 }
             } catch (error) {